@@ -53,6 +53,36 @@ class Settings(BaseSettings):
     # OpenAI & Anthropic
     OPENAI_API_KEY: str
     ANTHROPIC_API_KEY: str
+    LLM_CONCURRENCY: int = Field(
+        8,
+        description="타임라인 일괄 번역 시 동시에 실행할 최대 LLM 요청 수",
+    )
+    LLM_BATCH_MAX_ITEMS: int = Field(
+        8,
+        description="일괄 번역 시 LLM 요청 1회에 묶을 최대 트윗 수",
+    )
+    LLM_BATCH_MAX_CHARS: int = Field(
+        4000,
+        description="일괄 번역 시 LLM 요청 1회에 묶을 원문 최대 글자 수 (프롬프트 길이 제한)",
+    )
+    LLM_RATE_LIMIT_PER_MINUTE: int = Field(
+        60,
+        description="프로세스 전체에서 1분 동안 보낼 최대 LLM 요청 수 (429 재시도 방지)",
+    )
+
+    # Twitter
+    CONFIG_DIR: Path = Field(
+        default=BASE_DIR / "config",
+        description="쿠키 등 런타임 설정 파일 디렉토리 (기본: app/config)",
+    )
+    TWITTER_HTTP2: bool = Field(
+        True,
+        description="twikit 내부 httpx 클라이언트에 HTTP/2 + keep-alive 풀 튜닝 적용 (False면 twikit 기본 설정)",
+    )
+    TWITTER_TIMELINE_RATE_LIMIT: int = Field(
+        50,
+        description="사용자 세션별 15분 동안 보낼 최대 타임라인(get_user_tweets) 요청 수",
+    )
 
     # RAG / FAISS
     FAISS_INDEX_PATH: str = Field(
@@ -63,21 +93,29 @@ class Settings(BaseSettings):
         default=str(BASE_DIR / "rag_data" / "vector_store" / "metadata.json"),
         description="FAISS 메타데이터 파일 경로",
     )
+    BM25_INDEX_PATH: str = Field(
+        default=str(BASE_DIR / "rag_data" / "vector_store" / "bm25_index.npz"),
+        description="BM25 posting 배열 파일 경로 (없으면 기동 시 코퍼스로부터 생성)",
+    )
     RAG_TOP_K: int = Field(
         10,
         description="RAG 질의 시 상위 K개 문서 선택",
     )
+    RAG_ONNX_MODEL_DIR: Optional[str] = Field(
+        None,
+        description="ONNX(INT8) 임베딩 모델 디렉토리 (미설정 시 SentenceTransformer 사용)",
+    )
 
     # Legacy Settings
     ollama_api_url: Optional[str]
     ollama_model:   Optional[str]
 
-    @validator("FAISS_INDEX_PATH", "FAISS_META_PATH", pre=True)
-    def _validate_paths(cls, v: str) -> str:
+    @validator("FAISS_INDEX_PATH", "FAISS_META_PATH", "BM25_INDEX_PATH", "RAG_ONNX_MODEL_DIR", pre=True)
+    def _validate_paths(cls, v: Optional[str]) -> Optional[str]:
         """
         파일 경로 필드가 절대 경로가 아닐 경우 BASE_DIR 기준으로 변환
         """
-        return _resolve_path(v)
+        return _resolve_path(v) if v else v
 
     @validator("DATABASE_URL", pre=True, always=True)
     def _assemble_database_url(cls, v: Optional[str], values) -> str:
@@ -13,6 +13,7 @@ from app.core.database import get_db_session
 from app.jwt.blocklist import jwt_blocklist
 from app.repositories.user_repository import UserRepository
 from app.models.user import User
+from app.services.auth_service import AuthService as CoreAuthService
 from app.services.llm.pipeline_service import LLMPipelineService
 from app.services.llm.rag_service import RAGService
 from app.services.llm.llm_service import LLMService
@@ -126,25 +127,35 @@ async def get_current_user_optional(
         return None
 
     token = auth_header.split(" ", 1)[1]
-    from app.services.auth_service import AuthService as CoreAuthService
     try:
         return await CoreAuthService.get_current_user(token, db_session)
     except Exception:
         # 토큰이 만료되었거나 유효하지 않으면 None 처리
         return None
 
+_rag_service: Optional[RAGService] = None
+
 def get_rag_service(
     settings: Settings = Depends(get_settings)
 ) -> RAGService:
     """
     RAGService 의존성 주입 함수
     - settings.env에서 FAISS_INDEX_PATH, FAISS_META_PATH, RAG_TOP_K 등을 받아 반환
-    """
-    return RAGService(
-        index_path=settings.FAISS_INDEX_PATH,
-        meta_path=settings.FAISS_META_PATH,
-        top_k=settings.RAG_TOP_K,
-    )
+    - 인덱스/임베딩 모델/BM25 로딩 비용이 크므로 최초 호출 시에만 생성하고 이후에는 재사용
+    """
+    global _rag_service
+    if _rag_service is None:
+        _rag_service = RAGService(
+            index_path=settings.FAISS_INDEX_PATH,
+            meta_path=settings.FAISS_META_PATH,
+            top_k=settings.RAG_TOP_K,
+            onnx_model_dir=settings.RAG_ONNX_MODEL_DIR,
+            bm25_path=settings.BM25_INDEX_PATH,
+        )
+    return _rag_service
+
+_pipeline_service: Optional[LLMPipelineService] = None
+_llm_service: Optional[LLMService] = None
 
 def get_pipeline_service(
     rag: RAGService = Depends(get_rag_service)
@@ -152,8 +163,12 @@ def get_pipeline_service(
     """
     LLMPipelineService 의존성 주입 함수
     - RAGService가 필요
+    - 체인별 LLM 클라이언트(내부 HTTP 커넥션 풀 포함)를 요청마다 새로 만들지 않도록 재사용
     """
-    return LLMPipelineService(rag)
+    global _pipeline_service
+    if _pipeline_service is None:
+        _pipeline_service = LLMPipelineService(rag)
+    return _pipeline_service
 
 
 async def get_llm_service(
@@ -162,8 +177,12 @@ async def get_llm_service(
     """
     LLMService 의존성 주입 함수
     - LLMPipelineService가 필요
+    - 최초 호출 시에만 생성하고 이후에는 재사용
     """
-    return LLMService(pipeline)
+    global _llm_service
+    if _llm_service is None:
+        _llm_service = LLMService(pipeline)
+    return _llm_service
 
 
 
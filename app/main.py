@@ -1,4 +1,5 @@
 import os
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -11,12 +12,16 @@ from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.core.database import init_db
+from app.dependencies import get_rag_service
 from app.rag_data.build_faiss import build_faiss_index as build_faiss
 from app.routers.auth_router import router as auth_router
 from app.routers.protected import router as protected_router
 from app.routers.user_router import router as user_router
 from app.routers.tweet_router import router as tweet_router
 from app.routers.schedule_router import router as schedule_router
+from app.services.twitter.twitter_client_service import TwitterClientService
+from app.utils.http_client import close_http_client
+from app.utils.selenium_image_fetcher import close_driver_pool
 
 from app.utils.exceptions import (
     ApiError,
@@ -30,7 +35,8 @@ from app.utils.exceptions import (
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
-    앱 시작 시 DB 초기화 및 FAISS 인덱스 빌드 수행
+    앱 시작 시 DB 초기화, FAISS 인덱스 빌드 및 RAG 서비스 사전 로드 수행
+    앱 종료 시 공유 HTTP 커넥션 풀 / Twitter 클라이언트 커넥션 풀 / WebDriver 풀 정리
     """
     # DB 테이블 자동 생성
     await init_db()
@@ -42,8 +48,18 @@ async def lifespan(app: FastAPI):
     if not faiss_index_path.exists() or not faiss_meta_path.exists():
         build_faiss()
 
+    # RAG 서비스(인덱스/임베딩 모델 로드 + 워밍업)를 첫 요청 전에 미리 생성
+    await asyncio.to_thread(get_rag_service, settings)
+
     yield
 
+    # 공유 httpx.AsyncClient 커넥션 풀 종료
+    await close_http_client()
+    # 캐시된 사용자별 twikit 클라이언트의 httpx 커넥션 풀 종료
+    await TwitterClientService.close_all()
+    # 재사용 중이던 headless Chrome 종료
+    await asyncio.to_thread(close_driver_pool)
+
 
 # ─── FastAPI 애플리케이션 인스턴스 생성 ─────────────────────────────────────
 app = FastAPI(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -9,6 +9,10 @@ class Schedule(Base):
     - 트위터 사용자 및 유저와의 관계 정의
     """
     __tablename__ = "schedules"
+    __table_args__ = (
+        # 오시별 일정 목록(WHERE related_twitter_internal_id ORDER BY start_at)을 인덱스 순서 그대로 조회
+        Index("ix_schedules_twitter_start", "related_twitter_internal_id", "start_at"),
+    )
 
     id: int = Column(
         Integer,
@@ -1,18 +1,27 @@
-import csv, json
+import csv
+import orjson
 from sentence_transformers import SentenceTransformer
 import faiss
 from pathlib import Path
 import numpy as np
 
+from app.services.llm.bm25_index import BM25Index, corpus_hash, tokenize_corpus
+
 # ─── 상수 정의 ─────────────────────────────────────────────────────
 MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
 EMBEDDING_DIMENSION = 384
+HNSW_MIN_VECTORS = 10_000
+HNSW_M = 32
+# 이 이상은 OPQ + IVF(HNSW coarse quantizer) + PQ로 압축 (벡터당 384*4B → 32B)
+IVFPQ_MIN_VECTORS = 100_000
+PQ_M = 32
 
 BASE_DIR = Path(__file__).resolve().parent
 DICT_CSV = BASE_DIR / "dict.csv"
 VECTOR_STORE_DIR = BASE_DIR / "vector_store"
 INDEX_FILE_PATH = VECTOR_STORE_DIR / "faiss_index.bin"
 METADATA_FILE_PATH = VECTOR_STORE_DIR / "metadata.json"
+BM25_FILE_PATH = VECTOR_STORE_DIR / "bm25_index.npz"
 
 def build_faiss_index() -> None:
     """
@@ -20,8 +29,9 @@ def build_faiss_index() -> None:
 
     1) dict.csv에서 일본어 용어 및 한국어 번역 데이터 로드
     2) SentenceTransformer로 임베딩 생성 후 정규화
-    3) FAISS FlatIP 인덱스 구축 및 파일로 저장
+    3) FAISS 인덱스(FlatIP, 대규모는 HNSW, 초대규모는 OPQ+IVF+PQ) 구축 및 파일로 저장
     4) 메타데이터(JSON)로 용어-번역 쌍 저장
+    5) BM25 posting 배열(.npz) 저장 (RAGService 기동 시 재토큰화 생략)
     """
 
     # 출력 디렉토리 생성
@@ -46,9 +56,21 @@ def build_faiss_index() -> None:
     faiss.normalize_L2(embeddings)
 
     # ── FAISS 인덱스 생성 및 저장 ─────────────────────────────────
-    faiss_index = faiss.IndexFlatIP(EMBEDDING_DIMENSION)
+    # 초대규모 사전은 OPQ+IVF+PQ(학습 필요), 대규모는 HNSW(로그 시간 탐색, 학습 불필요), 소규모는 FlatIP
     num_embeddings = embeddings.shape[0]
     embeddings = embeddings.astype(np.float32)
+    if num_embeddings >= IVFPQ_MIN_VECTORS:
+        nlist = int(4 * np.sqrt(num_embeddings))
+        faiss_index = faiss.index_factory(
+            EMBEDDING_DIMENSION,
+            f"OPQ{PQ_M},IVF{nlist}_HNSW{HNSW_M},PQ{PQ_M}",
+            faiss.METRIC_INNER_PRODUCT,
+        )
+        faiss_index.train(embeddings)
+    elif num_embeddings >= HNSW_MIN_VECTORS:
+        faiss_index = faiss.IndexHNSWFlat(EMBEDDING_DIMENSION, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+    else:
+        faiss_index = faiss.IndexFlatIP(EMBEDDING_DIMENSION)
     faiss_index.add(embeddings)
     faiss.write_index(faiss_index, str(INDEX_FILE_PATH))
 
@@ -57,10 +79,16 @@ def build_faiss_index() -> None:
         {"text": source_terms[i], "translation": target_translations[i]}
         for i in range(len(source_terms))
     ]
-    with open(METADATA_FILE_PATH, "w", encoding="utf-8") as mf:
-        json_text = json.dumps(metadata_entries, ensure_ascii=False, indent=2)
-        mf.write(json_text)
+    # orjson은 비ASCII 문자를 이스케이프하지 않고 UTF-8 bytes로 바로 직렬화
+    METADATA_FILE_PATH.write_bytes(orjson.dumps(metadata_entries, option=orjson.OPT_INDENT_2))
+
+    # ── BM25 인덱스 생성 및 저장 ───────────────────────────────────
+    bm25_index = BM25Index.build(
+        tokenize_corpus(source_terms),
+        corpus_hash=corpus_hash(source_terms),
+    )
+    bm25_index.save(str(BM25_FILE_PATH))
 
 if __name__ == "__main__":
     build_faiss_index()
-    print(f"FAISS 인덱스 및 메타데이터 생성 완료:\n  - Index: {INDEX_FILE_PATH}\n  - Metadata: {METADATA_FILE_PATH}")
+    print(f"FAISS 인덱스 및 메타데이터 생성 완료:\n  - Index: {INDEX_FILE_PATH}\n  - Metadata: {METADATA_FILE_PATH}\n  - BM25: {BM25_FILE_PATH}")
@@ -0,0 +1,44 @@
+"""
+RAG 임베딩 모델 ONNX export 스크립트 (오프라인 빌드 전용)
+
+- 서버 런타임에서는 import 하지 않으며, 생성된 onnx_model/ 디렉토리만 사용
+- 실행에는 optimum[onnxruntime]이 필요 (requirements.txt에 포함)
+- 실행: python -m app.rag_data.export_onnx
+"""
+from pathlib import Path
+
+from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer
+
+# ─── 상수 정의 ─────────────────────────────────────────────────────
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+BASE_DIR = Path(__file__).resolve().parent
+ONNX_MODEL_DIR = BASE_DIR / "onnx_model"
+
+def export_onnx_model() -> None:
+    """
+    RAG용 MiniLM 임베딩 모델을 ONNX로 내보내고 동적 INT8 양자화를 적용
+
+    1) HuggingFace 모델을 ONNX(FP32)로 export
+    2) ORTQuantizer로 동적 INT8(per-channel) 양자화 → model_quantized.onnx
+    3) 토크나이저를 같은 디렉토리에 저장 (OnnxSentenceEmbedder가 함께 로드)
+    """
+    ONNX_MODEL_DIR.mkdir(parents=True, exist_ok=True)
+
+    # 1) ONNX export
+    model = ORTModelForFeatureExtraction.from_pretrained(MODEL_NAME, export=True)
+    model.save_pretrained(ONNX_MODEL_DIR)
+
+    # 2) 동적 INT8 양자화
+    quantizer = ORTQuantizer.from_pretrained(ONNX_MODEL_DIR)
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+    quantizer.quantize(save_dir=ONNX_MODEL_DIR, quantization_config=qconfig)
+
+    # 3) 토크나이저 저장
+    AutoTokenizer.from_pretrained(MODEL_NAME).save_pretrained(ONNX_MODEL_DIR)
+
+if __name__ == "__main__":
+    export_onnx_model()
+    print(f"ONNX 임베딩 모델 생성 완료:\n  - Model dir: {ONNX_MODEL_DIR}")
@@ -4,9 +4,10 @@ from sqlalchemy.exc import SQLAlchemyError
 from abc import ABC, abstractmethod
 
 from datetime import datetime
-from typing import Optional, List, Set, Dict, Any
-from sqlalchemy import select, and_, or_, delete
-from sqlalchemy.orm import selectinload
+from typing import Optional, List, Set, Dict, Any, AsyncIterator
+from sqlalchemy import select, and_, or_, delete, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import contains_eager, selectinload
 
 from app.models.post import Post
 from app.models.reply_log import ReplyLog
@@ -18,6 +19,9 @@ from app.repositories.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 커서 기반 포스트 스트리밍 조회 시 DB 드라이버에서 한 번에 가져올 행 수
+POST_STREAM_BATCH_SIZE = 200
+
 
 # ==================== 베이스 Repository ====================
 class BaseRepository(ABC):
@@ -117,6 +121,10 @@ class PostDataAccess:
     async def list_tweet_ids(self) -> Set[int]:
         pass
 
+    @abstractmethod
+    async def existing_tweet_ids(self, tweet_ids: List[int]) -> Set[int]:
+        pass
+
     @abstractmethod
     async def list_recent_posts(self, limit: int) -> List[Post]:
         pass
@@ -128,6 +136,13 @@ class PostDataAccess:
     ) -> List[Post]:
         pass
 
+    @abstractmethod
+    def stream_posts_by_cursor(
+            self, twitter_id: str, limit: int,
+            last_date: Optional[datetime], last_id: Optional[int]
+    ) -> AsyncIterator[Post]:
+        pass
+
 
 class ReplyLogDataAccess:
     """ReplyLog 엔티티 데이터 접근 인터페이스"""
@@ -168,6 +183,20 @@ class PostDataAccessImpl(PostDataAccess):
             logger.error(f"트윗 ID 목록 조회 실패: {e}")
             raise RepositoryError(f"트윗 ID 목록 조회 중 오류: {e}")
 
+    async def existing_tweet_ids(self, tweet_ids: List[int]) -> Set[int]:
+        """주어진 트윗 ID 중 DB에 이미 저장된 ID 집합 반환 (PK IN 조회)"""
+        if not tweet_ids:
+            return set()
+        try:
+            query = select(Post.tweet_id).where(Post.tweet_id.in_(tweet_ids))
+            result = await self.session.execute(query)
+            found = set(result.scalars().all())
+            logger.debug("저장된 트윗 ID 조회: requested=%d, found=%d", len(tweet_ids), len(found))
+            return found
+        except SQLAlchemyError as e:
+            logger.error(f"저장된 트윗 ID 조회 실패: {e}")
+            raise RepositoryError(f"저장된 트윗 ID 조회 중 오류: {e}")
+
     async def list_recent_posts(self, limit: int = 20) -> List[Post]:
         """최근 포스트 목록 조회"""
         try:
@@ -191,35 +220,71 @@ class PostDataAccessImpl(PostDataAccess):
             last_date: Optional[datetime] = None,
             last_id: Optional[int] = None,
     ) -> List[Post]:
-        """keyset pagination으로 포스트 목록 조회"""
+        """
+        keyset pagination으로 포스트 목록 조회
+        - 필터용으로 이미 조인한 TwitterUser 행으로 author를 채움 (추가 SELECT 없이 쿼리 1회)
+        """
         try:
-            base_q = select(Post).options(selectinload(Post.author)) \
-                .join(TwitterUser, Post.author_internal_id == TwitterUser.twitter_internal_id) \
-                .where(TwitterUser.twitter_id == twitter_id)
-
-            if last_date and last_id:
-                base_q = base_q.where(
-                    or_(
-                        Post.tweet_date < last_date,
-                        and_(
-                            Post.tweet_date == last_date,
-                            Post.tweet_id < last_id
-                        )
-                    )
-                )
-
-            query = base_q.order_by(Post.tweet_date.desc(), Post.tweet_id.desc()).limit(limit)
+            query = self._posts_by_cursor_query(twitter_id, limit, last_date, last_id)
             result = await self.session.execute(query)
             return list(result.scalars().all())
         except SQLAlchemyError as e:
             logger.error(f"커서 기반 포스트 조회 실패: {e}")
             raise RepositoryError(f"커서 기반 포스트 조회 중 오류: {e}")
 
+    async def stream_posts_by_cursor(
+            self,
+            twitter_id: str,
+            limit: int,
+            last_date: Optional[datetime] = None,
+            last_id: Optional[int] = None,
+    ) -> AsyncIterator[Post]:
+        """
+        list_posts_by_cursor와 같은 조회를 서버 측 커서로 POST_STREAM_BATCH_SIZE개씩 가져오며 하나씩 yield
+        - 페이지가 커도 전체 Post 리스트를 메모리에 만들지 않음
+        """
+        try:
+            query = self._posts_by_cursor_query(twitter_id, limit, last_date, last_id) \
+                .execution_options(yield_per=POST_STREAM_BATCH_SIZE)
+            result = await self.session.stream_scalars(query)
+            async for post in result:
+                yield post
+        except SQLAlchemyError as e:
+            logger.error(f"커서 기반 포스트 스트리밍 조회 실패: {e}")
+            raise RepositoryError(f"커서 기반 포스트 조회 중 오류: {e}")
+
+    @staticmethod
+    def _posts_by_cursor_query(
+            twitter_id: str,
+            limit: int,
+            last_date: Optional[datetime],
+            last_id: Optional[int],
+    ):
+        """keyset pagination 조회 쿼리 생성 (작성자는 필터용 조인 결과로 채움)"""
+        base_q = select(Post) \
+            .join(TwitterUser, Post.author_internal_id == TwitterUser.twitter_internal_id) \
+            .options(contains_eager(Post.author)) \
+            .where(TwitterUser.twitter_id == twitter_id)
+
+        if last_date and last_id:
+            base_q = base_q.where(
+                or_(
+                    Post.tweet_date < last_date,
+                    and_(
+                        Post.tweet_date == last_date,
+                        Post.tweet_id < last_id
+                    )
+                )
+            )
+
+        return base_q.order_by(Post.tweet_date.desc(), Post.tweet_id.desc()).limit(limit)
+
     async def list_posts_by_username(self, twitter_id: str, limit: int = 20) -> List[Post]:
-        """특정 사용자의 포스트 목록 조회"""
+        """특정 사용자의 포스트 목록 조회 (조인한 TwitterUser 행으로 author를 채움)"""
         try:
-            query = select(Post).options(selectinload(Post.author)) \
+            query = select(Post) \
                 .join(TwitterUser, Post.author_internal_id == TwitterUser.twitter_internal_id) \
+                .options(contains_eager(Post.author)) \
                 .where(TwitterUser.twitter_id == twitter_id) \
                 .order_by(Post.tweet_date.desc()).limit(limit)
             result = await self.session.execute(query)
@@ -236,7 +301,6 @@ class ReplyLogDataAccessImpl(ReplyLogDataAccess):
         self.session = session
 
     async def delete_by_tweet_id(self, tweet_id: int) -> None:
-        from app.models.reply_log import ReplyLog
         """특정 트윗의 답글 로그 삭제"""
         try:
             query = delete(ReplyLog).where(ReplyLog.post_tweet_id == tweet_id)
@@ -264,6 +328,23 @@ class PostManager:
             logger.error(f"Post 추가 실패: {e}")
             raise RepositoryError(f"Post 추가 중 오류: {e}")
 
+    async def bulk_insert(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Post 행(dict) 목록을 하나의 multi-row INSERT로 추가
+        - ON DUPLICATE KEY UPDATE tweet_id=tweet_id: 이미 저장된 tweet_id(PK 충돌)만 변경 없이 건너뜀
+          (INSERT IGNORE와 달리 FK/NOT NULL/길이 초과 등 다른 제약 위반은 그대로 오류 발생)
+        """
+        if not rows:
+            return
+        try:
+            stmt = mysql_insert(Post)
+            stmt = stmt.on_duplicate_key_update(tweet_id=stmt.inserted.tweet_id)
+            await self.session.execute(stmt, rows)
+            logger.debug("Post 일괄 추가: count=%d", len(rows))
+        except SQLAlchemyError as e:
+            logger.error("Post 일괄 추가 실패: %s", e)
+            raise RepositoryError(f"Post 일괄 추가 중 오류: {e}") from e
+
 
 class ReplyLogManager:
     """
@@ -307,6 +388,10 @@ class TweetRepository(BaseRepository):
         """DB에 저장된 모든 트윗 ID를 집합으로 반환"""
         return await self.post_data.list_tweet_ids()
 
+    async def existing_tweet_ids(self, tweet_ids: List[int]) -> Set[int]:
+        """주어진 트윗 ID 중 DB에 이미 저장된 ID만 집합으로 반환"""
+        return await self.post_data.existing_tweet_ids(tweet_ids)
+
     async def list_recent_posts(self, limit: int = 20) -> List[Post]:
         """
         가장 최근에 저장된 Post 객체를 반환
@@ -343,11 +428,37 @@ class TweetRepository(BaseRepository):
             twitter_id, limit, last_date, last_id
         )
 
+    def stream_posts_by_cursor(
+            self,
+            twitter_id: str,
+            limit: int,
+            last_date: Optional[datetime] = None,
+            last_id: Optional[int] = None,
+    ) -> AsyncIterator[Post]:
+        """
+        keyset pagination을 사용한 포스트 스트리밍 조회 (async for로 소비)
+
+        Args:
+            twitter_id: 조회할 트위터 사용자 ID
+            limit: 조회할 최대 개수
+            last_date: 마지막으로 조회한 포스트의 날짜
+            last_id: 마지막으로 조회한 포스트의 ID
+
+        Returns:
+            AsyncIterator[Post]: 조회된 포스트를 하나씩 반환하는 비동기 이터레이터
+        """
+        if limit <= 0:
+            raise ValueError("limit은 0보다 큰 값이어야 합니다.")
+
+        return self.post_data.stream_posts_by_cursor(
+            twitter_id, limit, last_date, last_id
+        )
+
     async def list_posts_by_username(self, twitter_id: str, limit: int = 20) -> List[Post]:
         """
         특정 트위터 유저의 최근 Post 목록 반환
         - TwitterUser와 조인 후 필터링
-        - 작성자 관계 eager load
+        - 작성자 관계는 같은 조인 결과로 채움 (contains_eager)
         """
         if limit <= 0:
             raise ValueError("limit은 0보다 큰 값이어야 합니다.")
@@ -360,6 +471,24 @@ class TweetRepository(BaseRepository):
             raise ValueError("Post 인스턴스가 아닙니다.")
         self.post_manager.insert(post)
 
+    async def bulk_insert_posts(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Post 행(dict) 목록을 INSERT 한 번으로 저장하고 커밋
+        - 이미 저장된 tweet_id는 건너뜀 (동시 동기화로 인한 중복 허용)
+        """
+        if not rows:
+            logger.info("저장할 포스트가 없습니다.")
+            return
+
+        try:
+            await self.post_manager.bulk_insert(rows)
+            await self.commit()
+            logger.info("일괄 포스트 저장 완료: count=%d", len(rows))
+        except Exception as e:
+            await self.rollback()
+            logger.error("일괄 포스트 저장 실패, 롤백 수행: count=%d, error=%s", len(rows), e)
+            raise
+
     # ==================== ReplyLog 관련 메서드 ====================
     def add_reply_log(self, log: ReplyLog) -> None:
         """ReplyLog 객체를 세션에 추가"""
@@ -488,8 +617,10 @@ class TweetRepository(BaseRepository):
             result = await self.session.execute(select(1))
             result.scalar()
 
-            # 포스트 총 개수
-            total_posts = len(await self.list_tweet_ids())
+            # 포스트 총 개수 (ID 전체를 가져오지 않고 DB에서 COUNT)
+            total_posts = (
+                await self.session.execute(select(func.count()).select_from(Post))
+            ).scalar_one()
 
             return {
                 "status": "healthy",
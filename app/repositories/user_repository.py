@@ -79,8 +79,6 @@ class UserRepository:
         """
         주어진 유저의 UserOshi 엔티티를 삭제
         """
-        from app.models.user_oshi import UserOshi
-
         # 1) UserOshi 찾기
         query = select(UserOshi).where(UserOshi.user_id == user_id)
         result = await self.session.execute(query)
@@ -87,7 +87,7 @@ async def signup(
     user_client.set_initial_cookies(req.ct0, req.auth_token)
     try:
         await user_client.ensure_login()
-        user_client.save_cookies_to_file()
+        await user_client.save_cookies_to_file()
         logger.info("Per-user 쿠키 저장 성공")
     except Exception as e:
         logger.warning("Per-user 쿠키 저장 실패: %s", e)
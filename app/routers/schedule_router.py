@@ -56,7 +56,7 @@ def _get_twitter_services_for_user(user: User) -> TwitterUserService:
     if not internal_id:
         # ApiError 중 하나(400 Bad Request) 던지기
         raise BadRequestError("먼저 트위터 계정을 연결해 주세요.")
-    client_svc = TwitterClientService(user_internal_id=internal_id)
+    client_svc = TwitterClientService.get_or_create(internal_id)
     return TwitterUserService(client_svc)
 
 
@@ -103,8 +103,10 @@ async def list_my_oshi_schedules(
     로그인 유저가 오시로 등록한 트위터 계정 기반으로 일정 조회
     """
     schedule_service = ScheduleService(db)
-    schedules = await schedule_service.list_my_oshi_schedules(current_user.id)
-    return [to_schedule_response(s) for s in schedules]
+    return [
+        to_schedule_response(s)
+        async for s in schedule_service.list_my_oshi_schedules(current_user.id)
+    ]
 
 
 @router.put("/{schedule_id}", response_model=ScheduleResponse)
@@ -93,7 +93,7 @@ async def update_my_oshi(
     3) UserOshi 엔티티 upsert 및 DB 커밋
     """
     # 1) 서비스 초기화
-    client_svc = TwitterClientService(user_internal_id=current_user.twitter_user_internal_id)
+    client_svc = TwitterClientService.get_or_create(current_user.twitter_user_internal_id)
     twitter_svc = TwitterUserService(client_svc)
 
     # 2) 입력된 screen_name 검증
@@ -171,7 +171,7 @@ async def get_user_profile(
         if current_user and current_user.twitter_user_internal_id
         else "public"
     )
-    client_svc = TwitterClientService(user_internal_id=user_internal)
+    client_svc = TwitterClientService.get_or_create(user_internal)
     twitter_svc = TwitterUserService(client_svc)
     try:
         await client_svc.ensure_login()
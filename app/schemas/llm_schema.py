@@ -21,6 +21,19 @@ class TranslationResult(BaseModel):
     start:      Optional[str] = None  # 이벤트 시작 시각 (YYYY.MM.DD HH:MM:SS)
     end:        Optional[str] = None  # 이벤트 종료 시각 (YYYY.MM.DD HH:MM:SS)
 
+class ClassificationResult(BaseModel):
+    """
+    LLM 분류 체인의 JSON 출력 모델 (ClassificationChain은 JSON 모드로 호출)
+
+    속성:
+      category:    분류 카테고리 (예: '일반', '라디오' 등)
+      title:       일정/이벤트 제목 (일반 카테고리는 None)
+      description: 간단한 상세정보 (일반 카테고리는 None)
+    """
+    category:    str                    # 분류 카테고리
+    title:       Optional[str] = None   # 제목
+    description: Optional[str] = None   # 상세정보
+
 class ReplyResult(BaseModel):
     """
     LLM을 이용해 생성된 자동 리플라이 결과를 나타내는 모델
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, validator
 from typing import List, Optional
-import json
+import orjson
 
 
 # ─── 트윗 관련 요청 스키마 정의 ─────────────────────────────────────────
@@ -28,8 +28,8 @@ class TweetResponse(BaseModel):
             return []
         # JSON 문자열 → Python 리스트
         try:
-            return json.loads(v)
-        except json.JSONDecodeError:
+            return orjson.loads(v)
+        except orjson.JSONDecodeError:
             # 파싱 실패 시 빈 리스트 또는 원본 문자열 리스트로
             return []
 
@@ -83,7 +83,7 @@ class AuthService:
             self.twitter_svc.client_service.set_initial_cookies(
                 ct0=data.ct0, auth_token=data.auth_token
             )
-            self.twitter_svc.client_service.save_cookies_to_file()
+            await self.twitter_svc.client_service.save_cookies_to_file()
             logger.info("Twitter cookies saved for user: %s", internal_id)
         except Exception as e:
             logger.error(f"쿠키 저장 실패: {e}")
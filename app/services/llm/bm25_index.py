@@ -0,0 +1,223 @@
+import hashlib
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from fugashi import Tagger
+
+# 이 문서 수 이상일 때만 프로세스 풀로 병렬 토큰화 (그 이하는 프로세스 기동 비용이 더 큼)
+PARALLEL_TOKENIZE_MIN_DOCS = 2_000
+# 서버 기동 중(torch/FAISS 로드 후, 다른 스레드 실행 중)에도 호출되므로
+# 부모의 lock 상태를 복사하는 fork 대신 새 인터프리터로 시작하는 spawn 사용
+TOKENIZE_MP_CONTEXT = "spawn"
+TOKENIZE_CHUNK_SIZE = 256
+
+# MeCab 분かち書き(-Owakati) 출력: 표층형을 공백으로 구분한 문자열 한 개를 C 레벨에서 생성
+TAGGER_ARGS = "-Owakati"
+# 토큰화 규칙이 바뀌면 값을 바꿔 저장된 BM25 인덱스를 무효화 (corpus_hash에 포함)
+TOKENIZER_VERSION = "wakati-lower-1"
+
+# MeCab Tagger는 스레드 안전하지 않으므로 스레드별로 1개씩 생성하여 모든 RAGService가 공유
+_thread_local = threading.local()
+
+
+def get_tagger() -> Tagger:
+    """
+    현재 스레드의 공유 Tagger(-Owakati)를 반환 (최초 호출 시 생성)
+    """
+    tagger = getattr(_thread_local, "tagger", None)
+    if tagger is None:
+        tagger = _thread_local.tagger = Tagger(TAGGER_ARGS)
+    return tagger
+
+
+def tokenize_ja(text: str) -> List[str]:
+    """
+    일본어 형태소 단위로 토큰화
+    - MeCab wakati 출력을 한 번에 소문자화 후 split (형태소별 Python 노드 객체 생성 없음)
+    - sys.intern으로 중복 토큰이 같은 str 객체를 공유하도록 함
+    - 오프라인 인덱스 빌드와 질의 시점이 반드시 같은 토큰화를 쓰도록 이 함수를 공유
+    """
+    return [sys.intern(token) for token in get_tagger().parse(text).lower().split()]
+
+
+def _init_tokenize_worker() -> None:
+    """
+    ProcessPoolExecutor 워커 초기화: 워커 프로세스 전용 Tagger를 미리 생성
+    """
+    _thread_local.tagger = Tagger(TAGGER_ARGS)
+
+
+def tokenize_corpus(texts: List[str], max_workers: Optional[int] = None) -> List[List[str]]:
+    """
+    코퍼스 전체를 토큰화
+    - 대규모 코퍼스는 CPU 코어 수만큼 프로세스를 띄워 청크 단위로 병렬 처리 (spawn 시작 방식)
+    """
+    if len(texts) < PARALLEL_TOKENIZE_MIN_DOCS:
+        return [tokenize_ja(text) for text in texts]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context(TOKENIZE_MP_CONTEXT),
+        initializer=_init_tokenize_worker,
+    ) as executor:
+        return list(executor.map(tokenize_ja, texts, chunksize=TOKENIZE_CHUNK_SIZE))
+
+
+def corpus_hash(texts: List[str]) -> str:
+    """
+    토큰화 규칙 버전 + 코퍼스 내용의 sha256 해시
+    (저장된 BM25 인덱스가 현재 메타데이터/토큰화 규칙과 일치하는지 확인용)
+    """
+    digest = hashlib.sha256(TOKENIZER_VERSION.encode("utf-8"))
+    for text in texts:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class BM25Index:
+    """
+    NumPy 기반 BM25(Okapi) 인덱스
+    - 용어별 posting list를 CSR 배열(indptr / doc_ids / tfs)로 보관
+    - rank_bm25.BM25Okapi와 같은 점수(k1, b, epsilon 하한 idf)를 계산하되,
+      posting별 가중치를 미리 계산해두고 질의어의 posting만 scatter-add하므로
+      코퍼스 전체 Python 루프나 질의 시 산술 연산이 없음
+    - build_faiss.py에서 .npz로 저장해두면 워커 기동 시 코퍼스 재토큰화가 필요 없음
+    """
+    def __init__(
+        self,
+        vocab: List[str],
+        indptr: np.ndarray,
+        doc_ids: np.ndarray,
+        tfs: np.ndarray,
+        doc_len: np.ndarray,
+        idf: np.ndarray,
+        k1: float = 1.5,
+        b: float = 0.75,
+        corpus_hash: str = "",
+    ):
+        self.corpus_hash = corpus_hash
+        self.vocab: Dict[str, int] = {sys.intern(term): i for i, term in enumerate(vocab)}
+        self.indptr = indptr
+        self.doc_ids = doc_ids
+        self.tfs = tfs
+        self.doc_len = doc_len
+        self.idf = idf
+        self.k1 = k1
+        self.b = b
+        self.n_docs = len(doc_len)
+        self.avgdl = float(doc_len.mean()) if self.n_docs else 0.0
+        # (용어, 문서)별 BM25 기여도 idf·tf·(k1+1)/(tf + k1·(1 - b + b·|d|/avgdl))는
+        # 질의와 무관하므로 posting마다 미리 계산 → 질의 시에는 posting 가중치를 더하기만 함
+        norm = (
+            k1 * (1 - b + b * doc_len / self.avgdl)
+            if self.avgdl > 0 else np.zeros(self.n_docs, dtype=np.float32)
+        )
+        posting_idf = np.repeat(idf, np.diff(indptr))
+        self.weights = (
+            posting_idf * tfs * (k1 + 1) / (tfs + norm[doc_ids])
+        ).astype(np.float32)
+
+    @classmethod
+    def build(
+        cls,
+        tokenized_corpus: List[List[str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+        corpus_hash: str = "",
+    ) -> "BM25Index":
+        """
+        토큰화된 코퍼스로부터 인덱스 생성
+        1) 문서별 용어 빈도(tf) 집계
+        2) 용어 → (doc_id, tf) posting list를 CSR 배열로 변환
+        3) BM25Okapi와 동일한 idf 계산 (음수 idf는 epsilon * 평균 idf로 대체)
+        """
+        # 1) 문서별 tf 집계
+        postings: Dict[str, List[tuple]] = {}
+        doc_len = np.zeros(len(tokenized_corpus), dtype=np.float32)
+        for doc_id, tokens in enumerate(tokenized_corpus):
+            doc_len[doc_id] = len(tokens)
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, tf in counts.items():
+                postings.setdefault(token, []).append((doc_id, tf))
+
+        # 2) CSR 배열 변환
+        vocab = list(postings)
+        indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+        for i, term in enumerate(vocab):
+            indptr[i + 1] = indptr[i] + len(postings[term])
+        doc_ids = np.empty(indptr[-1], dtype=np.int32)
+        tfs = np.empty(indptr[-1], dtype=np.float32)
+        for i, term in enumerate(vocab):
+            start, end = indptr[i], indptr[i + 1]
+            ids, term_tfs = zip(*postings[term])
+            doc_ids[start:end] = ids
+            tfs[start:end] = term_tfs
+
+        # 3) idf 계산
+        n_docs = len(tokenized_corpus)
+        doc_freq = np.diff(indptr).astype(np.float64)
+        idf = np.log(n_docs - doc_freq + 0.5) - np.log(doc_freq + 0.5)
+        if idf.size:
+            idf[idf < 0] = epsilon * idf.mean()
+
+        return cls(vocab, indptr, doc_ids, tfs, doc_len, idf.astype(np.float32), k1, b, corpus_hash)
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        """
+        save()로 저장한 .npz 파일에서 인덱스 로드
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                vocab=data["vocab"].tolist(),
+                indptr=data["indptr"],
+                doc_ids=data["doc_ids"],
+                tfs=data["tfs"],
+                doc_len=data["doc_len"],
+                idf=data["idf"],
+                k1=float(data["k1"]),
+                b=float(data["b"]),
+                corpus_hash=str(data["corpus_hash"]) if "corpus_hash" in data.files else "",
+            )
+
+    def save(self, path: str) -> None:
+        """
+        인덱스를 .npz 파일로 저장
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            vocab=np.array(list(self.vocab), dtype=np.str_),
+            indptr=self.indptr,
+            doc_ids=self.doc_ids,
+            tfs=self.tfs,
+            doc_len=self.doc_len,
+            idf=self.idf,
+            k1=np.float32(self.k1),
+            b=np.float32(self.b),
+            corpus_hash=np.str_(self.corpus_hash),
+        )
+
+    def get_scores(self, query_tokens: List[str]) -> np.ndarray:
+        """
+        질의 토큰 목록에 대한 전체 문서의 BM25 점수 (n_docs,) 반환
+        - 질의에 중복된 토큰은 BM25Okapi와 같이 중복 횟수만큼 더함
+        """
+        scores = np.zeros(self.n_docs, dtype=np.float32)
+        for token in query_tokens:
+            term_id = self.vocab.get(token)
+            if term_id is None:
+                continue
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            scores[self.doc_ids[start:end]] += self.weights[start:end]
+        return scores
@@ -1,38 +1,68 @@
 import logging
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
+
+import orjson
 
 from langchain_anthropic import ChatAnthropic
 from langchain.chat_models import ChatOpenAI
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.prompts import PromptTemplate
 from langchain.chains import LLMChain
 
-from app.services.llm.prompt_templates import PromptType, SYSTEM_PROMPTS, get_few_shot_examples
+from app.services.llm.prompt_templates import (
+    PromptType,
+    SYSTEM_PROMPTS,
+    BATCH_TRANSLATE_INSTRUCTION,
+    get_few_shot_examples,
+)
+from app.services.llm.schedule_extractor import extract_schedule
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _static_system_prompt(prompt_type: PromptType) -> str:
+    """
+    format 인자가 없는 system 프롬프트는 PromptType에만 의존하므로 한 번만 조립
+    """
+    return f"{get_few_shot_examples(prompt_type)}\n\n{SYSTEM_PROMPTS[prompt_type]}"
+
+
 def _build_system_prompt(prompt_type: PromptType, **kwargs) -> str:
     """
     few-shot 예시와 시스템 지침을 결합하여 완성된 system 프롬프트를 반환
     추가 매개변수가 필요할 경우 kwargs를 format에 사용
     """
+    if not kwargs:
+        return _static_system_prompt(prompt_type)
     few = get_few_shot_examples(prompt_type)
-    base = SYSTEM_PROMPTS[prompt_type].strip()
-    if kwargs:
-        base = base.format(**kwargs)
+    base = SYSTEM_PROMPTS[prompt_type].format(**kwargs)
     return f"{few}\n\n{base}"
 
 
-def _build_contexts(rag_service, text: str) -> str:
+def _build_contexts(rag_service, text: str, contexts: Optional[List[str]] = None) -> str:
     """
     RAG 서비스로부터 컨텍스트를 받아 리스트 형식으로 문자열을 생성
+    - contexts가 주어지면(배치로 미리 조회한 경우) RAG 조회를 생략
     """
-    contexts = rag_service.get_context(text)
+    if contexts is None:
+        contexts = rag_service.get_context(text)
     joined = "\n".join(f"- {c}" for c in contexts)
     logger.debug("RAG contexts for [%s]: %s", text, joined)
     return joined
 
 
+def _with_reference(contexts: str, body: str) -> str:
+    """
+    user 메시지 본문 앞에 RAG 참조 사전 블록을 붙여 반환
+    - 조회된 컨텍스트가 없으면 빈 "### Reference dictionary:" 헤더를 보내지 않음 (입력 토큰 절약)
+    """
+    if not contexts:
+        return body
+    return f"### Reference dictionary:\n{contexts}\n\n{body}"
+
+
 class TranslationChain:
     """
     텍스트 번역을 위한 LLM 체인
@@ -41,31 +71,64 @@ class TranslationChain:
     """
     def __init__(self, rag_service, model_name: str = "claude-3-7-sonnet-20250219"):
         self.rag = rag_service
+        # 동시 번역 시 429/5xx/타임아웃은 SDK의 지수 백오프 재시도로 처리
         self.llm = ChatAnthropic(
             model_name=model_name,
             timeout=120,
             temperature=0.3,
+            max_retries=5,
             stop=["\n\nHuman:"],
         )
-        prompt = PromptTemplate(
-            input_variables=["system", "contexts", "text"],
-            template="""
-<|system|>
-{system}
-
-### Reference dictionary:
-{contexts}
-
-<|user|>
-{text}
-""".strip(),
+        # system 프롬프트는 요청마다 같으므로 생성 시 한 번만 조립하여 별도 system 메시지로 고정
+        # → 매 요청 동일한 prefix가 되어 Anthropic prompt caching(cache_control) 적중
+        #   (요청마다 바뀌는 RAG 사전과 원문은 user 메시지로 분리)
+        self.system_message = SystemMessage(content=[{
+            "type": "text",
+            "text": _build_system_prompt(PromptType.TRANSLATE),
+            "cache_control": {"type": "ephemeral"},
+        }])
+
+    def run(self, text: str, timestamp: str, contexts: Optional[List[str]] = None) -> str:
+        contexts = _build_contexts(self.rag, text, contexts)
+        user_message = HumanMessage(content=_with_reference(contexts, text))
+        return self.llm.invoke([self.system_message, user_message]).content
+
+    def run_batch(self, texts: List[str], contexts: List[List[str]]) -> List[str]:
+        """
+        여러 텍스트를 한 번의 LLM 요청으로 번역 (요청 수 절감 + system 프롬프트 토큰 1회분)
+        1) 텍스트별 RAG 컨텍스트를 순서를 유지하며 중복 제거 후 하나의 사전으로 합침
+        2) [{"i", "text"}] JSON 배열을 user 메시지로 전달
+        3) 응답 JSON 배열을 i 기준으로 정렬하여 texts와 같은 순서의 번역 목록 반환
+
+        Raises:
+            ValueError: 응답이 JSON 배열이 아니거나 i가 입력과 일치하지 않을 때
+                        (호출 측에서 단건 번역으로 재시도)
+        """
+        # 1) 컨텍스트 병합
+        merged = list(dict.fromkeys(c for ctx in contexts for c in ctx))
+        joined = "\n".join(f"- {c}" for c in merged)
+
+        # 2) 배치 요청
+        payload = orjson.dumps(
+            [{"i": i, "text": text} for i, text in enumerate(texts)]
+        ).decode("utf-8")
+        user_message = HumanMessage(
+            content=_with_reference(joined, f"{BATCH_TRANSLATE_INSTRUCTION}\n\n{payload}")
         )
-        self.chain = LLMChain(llm=self.llm, prompt=prompt, output_key="translation")
+        raw = self.llm.invoke([self.system_message, user_message]).content
 
-    def run(self, text: str, timestamp: str) -> str:
-        system = _build_system_prompt(PromptType.TRANSLATE)
-        contexts = _build_contexts(self.rag, text)
-        return self.chain.predict(system=system, contexts=contexts, text=text)
+        # 3) 응답 파싱 (코드 블록 등 배열 바깥의 문자는 무시)
+        start, end = raw.find("["), raw.rfind("]")
+        if start < 0 or end < start:
+            raise ValueError(f"배치 번역 응답이 JSON 배열이 아님: {raw}")
+        try:
+            rows = orjson.loads(raw[start:end + 1])
+            by_index = {int(row["i"]): str(row["translated"]) for row in rows}
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"배치 번역 응답 파싱 실패: {e}") from e
+        if set(by_index) != set(range(len(texts))):
+            raise ValueError(f"배치 번역 응답 개수 불일치: {len(by_index)}/{len(texts)}")
+        return [by_index[i] for i in range(len(texts))]
 
 
 class ClassificationChain:
@@ -76,9 +139,18 @@ class ClassificationChain:
     """
     def __init__(self, rag_service, model_name: str = "o4-mini-2025-04-16"):
         self.rag = rag_service
-        self.llm = ChatOpenAI(model_name=model_name, temperature=1.0)
+        # JSON 모드: 응답이 항상 파싱 가능한 JSON 객체가 되도록 보장 (␞ 구분자 파싱 불필요)
+        # 429/5xx/타임아웃은 SDK의 지수 백오프 재시도로 처리 (기본값에 맡기지 않고 명시)
+        self.llm = ChatOpenAI(
+            model_name=model_name,
+            temperature=1.0,
+            request_timeout=120,
+            max_retries=5,
+            model_kwargs={"response_format": {"type": "json_object"}},
+        )
         prompt = PromptTemplate(
-            input_variables=["system", "contexts", "text"],
+            input_variables=["contexts", "text"],
+            partial_variables={"system": _build_system_prompt(PromptType.CLASSIFY)},
             template="""
 <|system|>
 {system}
@@ -93,9 +165,32 @@ class ClassificationChain:
         self.chain = LLMChain(llm=self.llm, prompt=prompt, output_key="category")
 
     def run(self, text: str) -> str:
-        system = _build_system_prompt(PromptType.CLASSIFY)
         contexts = _build_contexts(self.rag, text)
-        return self.chain.predict(system=system, contexts=contexts, text=text)
+        return self.chain.predict(contexts=contexts, text=text)
+
+
+# ScheduleChain 응답의 디버깅 라인 접두사 (최종 답변 라인이 아님)
+_SCHEDULE_DEBUG_PREFIXES = ("ANALYSIS:", "TIMES FOUND:", "START:", "END:")
+
+
+def _parse_schedule_line(result: str) -> Optional[str]:
+    """
+    LLM 응답에서 “start ␞ end” 최종 답변 라인을 한 번의 순회로 찾아 반환
+    - 디버깅 접두사가 없는 첫 ␞ 라인을 우선 사용
+    - 없으면 처음 본 ␞ 라인(디버깅 라인 포함)으로 대체, ␞ 라인이 없으면 None
+    """
+    fallback: Optional[str] = None
+    for line in result.splitlines():
+        if "␞" not in line:
+            continue
+        line = line.strip()
+        if not line.startswith(_SCHEDULE_DEBUG_PREFIXES):
+            return line
+        if fallback is None:
+            fallback = line
+    if fallback is not None:
+        logger.warning("␞가 포함된 최종 답변을 찾을 수 없음, 대체 결과 사용: %s", fallback)
+    return fallback
 
 
 class ScheduleChain:
@@ -107,60 +202,55 @@ class ScheduleChain:
 
     def __init__(self, model_name: str = "o4-mini-2025-04-16"):
         # o4-mini 모델은 temperature=1.0만 지원
-        self.llm = ChatOpenAI(model_name=model_name, temperature=1.0)
+        self.llm = ChatOpenAI(
+            model_name=model_name,
+            temperature=1.0,
+            request_timeout=120,
+            max_retries=5,
+        )
         self.base_template = "{system}\n\n{text}"
         prompt = PromptTemplate(
             input_variables=["system", "text"],
             template=self.base_template,
         )
         self.chain = LLMChain(llm=self.llm, prompt=prompt, output_key="schedule")
+        # system 프롬프트를 {timestamp} 자리표시자 기준으로 미리 분할
+        # → 요청마다 str.format(중괄호 스캔) 대신 timestamp.join 한 번으로 조립
+        few = get_few_shot_examples(PromptType.SCHEDULE)
+        self._system_parts = SYSTEM_PROMPTS[PromptType.SCHEDULE].split("{timestamp}")
+        self._system_parts[0] = f"{few}\n\n{self._system_parts[0]}"
 
     def run(self, text: str, timestamp: str) -> str:
-        import logging
-        logger = logging.getLogger(__name__)
+        logger.info("ScheduleChain 시작 - 입력 텍스트: %s", text)
+        logger.info("참조 타임스탬프: %s", timestamp)
 
-        logger.info(f"ScheduleChain 시작 - 입력 텍스트: {text}")
-        logger.info(f"참조 타임스탬프: {timestamp}")
+        # 규칙 기반 추출을 먼저 시도하고, 날짜 단서와 시각이 모두 있는 확실한 경우가 아니면 LLM 호출
+        extracted = extract_schedule(text, timestamp)
+        if extracted:
+            start, end = extracted
+            logger.info("규칙 기반 스케줄 추출 결과: %s ␞ %s", start, end)
+            return f"{start} ␞ {end}"
 
-        system = _build_system_prompt(PromptType.SCHEDULE, timestamp=timestamp)
+        system = timestamp.join(self._system_parts)
 
         # 프롬프트 로깅
-        logger.debug(f"시스템 프롬프트 길이: {len(system)} 문자")
+        logger.debug("시스템 프롬프트 길이: %s 문자", len(system))
 
         # LLM 호출
         try:
             result = self.chain.predict(system=system, text=text)
-            logger.info(f"ScheduleChain LLM 원본 응답: {result}")
+            logger.info("ScheduleChain LLM 원본 응답: %s", result)
 
             # 응답 파싱 : 디버깅 정보가 있다면 최종 답변만 추출
-            if "␞" in result:
-                lines = result.strip().split('\n')
-                final_line = None
-
-                # 최종 답변 라인 찾기 (ANALYSIS 등이 아닌 ␞가 포함된 라인)
-                for line in lines:
-                    line = line.strip()
-                    if "␞" in line and not line.startswith(("ANALYSIS:", "TIMES FOUND:", "START:", "END:")):
-                        final_line = line
-                        break
-
-                if final_line:
-                    logger.info(f"파싱된 최종 결과: {final_line}")
-                    return final_line
-                else:
-                    logger.warning("␞가 포함된 최종 답변을 찾을 수 없음")
-                    # 첫 번째 ␞가 포함된 라인을 사용
-                    for line in lines:
-                        if "␞" in line:
-                            logger.info(f"대체 결과 사용: {line.strip()}")
-                            return line.strip()
-                    return "None ␞ None"
-            else:
-                logger.warning(f"응답에 ␞ 구분자가 없음: {result}")
-                return "None ␞ None"
+            final_line = _parse_schedule_line(result)
+            if final_line:
+                logger.info("파싱된 최종 결과: %s", final_line)
+                return final_line
+            logger.warning("응답에 ␞ 구분자가 없음: %s", result)
+            return "None ␞ None"
 
         except Exception as e:
-            logger.error(f"ScheduleChain 실행 중 오류: {e}")
+            logger.error("ScheduleChain 실행 중 오류: %s", e)
             return "None ␞ None"
 
 
@@ -175,10 +265,12 @@ class ReplyChain:
             model_name=model_name,
             timeout=120,
             temperature=0.5,
+            max_retries=5,
             stop=["\n\nHuman:"],
         )
         prompt = PromptTemplate(
-            input_variables=["system", "contexts", "text"],
+            input_variables=["contexts", "text"],
+            partial_variables={"system": _build_system_prompt(PromptType.REPLY)},
             template="""
 <|system|>
 {system}
@@ -193,8 +285,7 @@ Existing replies (excluding the second one):
         self.chain = LLMChain(llm=self.llm, prompt=prompt, output_key="reply")
 
     def run(self, text: str, contexts: List[str]) -> str:
-        system = _build_system_prompt(PromptType.REPLY)
         # contexts를 리스트 그대로 전달 → 내부에서 PromptTemplate이 알아서 포맷
         joined = "\n".join(f"- {c}" for c in contexts)
         logger.debug("Reply contexts: %s", joined)
-        return self.chain.predict(system=system, contexts=joined, text=text)
\ No newline at end of file
+        return self.chain.predict(contexts=joined, text=text)
\ No newline at end of file
@@ -30,6 +30,26 @@ class LLMService:
         """
         return await self.pipeline.translate(text, timestamp)
 
+    async def translate_many(
+        self,
+        items: List[Tuple[str, str]],
+        concurrency: int = 10,
+        pack_size: int = 8,
+        pack_chars: int = 4000,
+    ) -> List[TranslationResult]:
+        """
+        여러 텍스트를 한 번에 번역 (RAG 컨텍스트를 배치로 조회, pack_size개/pack_chars자씩 묶어 동시 번역)
+
+        Args:
+            items: [(원문 텍스트, 타임스탬프), ...]
+            concurrency: 동시에 실행할 최대 번역 요청 수
+            pack_size: LLM 요청 1회에 묶을 최대 텍스트 수
+            pack_chars: LLM 요청 1회에 묶을 최대 글자 수
+        Returns:
+            List[TranslationResult]: items와 같은 순서의 번역 결과 목록
+        """
+        return await self.pipeline.translate_many(items, concurrency, pack_size, pack_chars)
+
     async def classify(self, text: str) -> Tuple[str, Optional[str], Optional[str]]:
         """
         텍스트 분류 및 일정 여부 추출
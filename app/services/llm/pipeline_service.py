@@ -1,5 +1,13 @@
 import asyncio
-from typing import Optional, Tuple, List
+import logging
+import re
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, List
+
+import orjson
+from pydantic import ValidationError
+
+from app.core.config import settings
 
 from app.services.llm.chains import (
     TranslationChain,
@@ -8,15 +16,46 @@ from app.services.llm.chains import (
     ReplyChain,
 )
 from app.services.llm.text_utils import TextMasker
-from app.schemas.llm_schema import TranslationResult, ReplyResult
+from app.schemas.llm_schema import TranslationResult, ReplyResult, ClassificationResult
+from app.utils.rate_limiter import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
 
 # TextMasker 함수들 가져오기
-mask_rt_prefix = TextMasker.mask_rt_prefix
+mask_all = TextMasker.mask_all
 restore_rt_prefix = TextMasker.restore_rt_prefix
-mask_hashtags = TextMasker.mask_hashtags
 restore_hashtags = TextMasker.restore_hashtags
 extract_emojis = TextMasker.extract_emojis
 
+# 히라가나/가타카나/한자/반각 가타카나 (하나도 없으면 번역할 일본어가 없음)
+_JP = re.compile(r"[\u3040-\u30FF\u4E00-\u9FFF\uFF66-\uFF9F]")
+
+# 원문 → 번역문 캐시 최대 항목 수 (리트윗·재게시로 같은 원문이 반복되는 경우 LLM 호출 생략)
+TRANSLATION_CACHE_SIZE = 4096
+
+# 모든 체인 호출이 공유하는 LLM 요청 속도 제한 (semaphore는 동시 실행 수, 이쪽은 분당 요청 수를 제한)
+_llm_limiter = AsyncRateLimiter(settings.LLM_RATE_LIMIT_PER_MINUTE, 60.0)
+
+
+def _pack_rows(rows: List[int], lengths: List[int], max_items: int, max_chars: int) -> List[List[int]]:
+    """
+    행 번호를 순서대로 묶음으로 분할
+    - 묶음당 최대 max_items개, 원문 길이 합은 max_chars 이하 (프롬프트 길이 제한)
+    - 한 행만으로 max_chars를 넘으면 그 행 단독으로 한 묶음
+    """
+    packs: List[List[int]] = []
+    current: List[int] = []
+    chars = 0
+    for row, length in zip(rows, lengths):
+        if current and (len(current) >= max_items or chars + length > max_chars):
+            packs.append(current)
+            current, chars = [], 0
+        current.append(row)
+        chars += length
+    if current:
+        packs.append(current)
+    return packs
+
 
 class LLMPipelineService:
     """
@@ -25,90 +64,235 @@ class LLMPipelineService:
     """
 
     def __init__(self, rag_service):
+        self.rag = rag_service
         self.trans_chain = TranslationChain(rag_service)
         self.class_chain = ClassificationChain(rag_service)
         self.sched_chain = ScheduleChain()
         self.reply_chain = ReplyChain()
+        # 원문 → 복원까지 끝난 번역문 (LRU, 이벤트 루프에서만 접근하므로 락 불필요)
+        self._translation_cache: "OrderedDict[str, str]" = OrderedDict()
+
+    def _cached_translation(self, text: str) -> Optional[str]:
+        """
+        캐시된 번역문 반환 (없으면 None)
+        """
+        cached = self._translation_cache.get(text)
+        if cached is not None:
+            self._translation_cache.move_to_end(text)
+        return cached
+
+    def _cache_translation(self, text: str, translated: str) -> None:
+        """
+        번역문을 캐시에 저장하고 최근 사용 순으로 TRANSLATION_CACHE_SIZE개까지만 유지
+        """
+        self._translation_cache[text] = translated
+        self._translation_cache.move_to_end(text)
+        while len(self._translation_cache) > TRANSLATION_CACHE_SIZE:
+            self._translation_cache.popitem(last=False)
+
+    async def run_chain(self, fn, *args):
+        """
+        동기 체인 메서드를 LLM 속도 제한을 거친 뒤 워커 스레드에서 실행
+        """
+        async with _llm_limiter:
+            return await asyncio.to_thread(fn, *args)
 
-    async def translate(self, text: str, timestamp: str) -> TranslationResult:
+    async def translate(
+        self,
+        text: str,
+        timestamp: str,
+        contexts: Optional[List[str]] = None,
+    ) -> TranslationResult:
         """
         번역 파이프라인:
         1) 해시태그, RT 접두사 마스킹 및 이모지 보존
         2) LLM 번역 실행
         3) 마스킹 복원 및 누락 이모지 추가
+        - contexts: 미리 조회한 RAG 컨텍스트 (없으면 체인 내부에서 조회)
         """
-        import logging
-        logger = logging.getLogger(__name__)
-
-        logger.info(f"번역 시작 - 원문: {text}")
+        logger.info("번역 시작 - 원문: %s", text)
 
         # 1) 전처리
-        # 1-1) 해시태그를 안전한 플레이스홀더로 마스킹
-        masked, tag_mappings = mask_hashtags(text)
-        logger.debug(f"해시태그 마스킹 후: {masked}")
-        logger.debug(f"태그 매핑: {tag_mappings}")
+        # 1-1) 해시태그와 RT @username: 을 한 번의 스캔으로 안전한 토큰으로 마스킹
+        masked, rt_prefix, tag_mappings = mask_all(text)
+        logger.debug("해시태그/RT 마스킹 후: %s", masked)
+        logger.debug("태그 매핑: %s", tag_mappings)
 
-        # 1-2) RT @username: 을 안전한 토큰으로 마스킹
-        masked, rt_prefix = mask_rt_prefix(masked)
-        logger.debug(f"RT 마스킹 후: {masked}")
+        # 1-2) 마스킹 후 일본어가 남아 있지 않으면(해시태그/이모지/URL만) LLM 호출 없이 원문 반환
+        if not _JP.search(masked):
+            logger.info("일본어 없음 - 번역 생략")
+            return TranslationResult(
+                translated=text,
+                category="일반",
+                start=None,
+                end=None,
+            )
 
         # 1-3) 원문 이모지 모두 추출
         emojis = extract_emojis(text)
-        logger.debug(f"추출된 이모지: {emojis}")
+        logger.debug("추출된 이모지: %s", emojis)
 
         # 2) 번역 실행 (동기 체인을 각각 개별 스레드로)
-        translated_masked = await asyncio.to_thread(
+        translated_masked = await self.run_chain(
             self.trans_chain.run,
             masked,
-            timestamp
+            timestamp,
+            contexts
         )
-        logger.debug(f"번역 결과 (마스킹된 상태): {translated_masked}")
+        logger.debug("번역 결과 (마스킹된 상태): %s", translated_masked)
 
         # 3) 후처리
-        # 3-1) RT 복원
-        restored = restore_rt_prefix(translated_masked, rt_prefix)
-        logger.debug(f"RT 복원 후: {restored}")
+        restored = self._restore(translated_masked, rt_prefix, tag_mappings, emojis)
+        logger.info("번역 완료 - 결과: %s", restored)
 
-        # 3-2) 해시태그 복원
-        restored = restore_hashtags(restored, tag_mappings)
-        logger.debug(f"해시태그 복원 후: {restored}")
+        return TranslationResult(
+            translated=restored,
+            category="일반",
+            start=None,
+            end=None,
+        )
 
-        # 3-3) 누락된 이모지가 있으면 뒤에 붙여줌
+    @staticmethod
+    def _restore(translated_masked: str, rt_prefix, tag_mappings, emojis: List[str]) -> str:
+        """
+        번역 결과 후처리
+        1) RT 복원
+        2) 해시태그 복원
+        3) 누락된 이모지가 있으면 뒤에 붙여줌
+        """
+        restored = restore_rt_prefix(translated_masked, rt_prefix)
+        restored = restore_hashtags(restored, tag_mappings)
         missing = [e for e in emojis if e not in restored]
         if missing:
             restored += "".join(missing)
-            logger.debug(f"누락 이모지 추가 후: {restored}")
+        return restored
 
-        logger.info(f"번역 완료 - 결과: {restored}")
+    async def translate_many(
+        self,
+        items: List[Tuple[str, str]],
+        concurrency: int = 10,
+        pack_size: int = 8,
+        pack_chars: int = 4000,
+    ) -> List[TranslationResult]:
+        """
+        여러 트윗(타임라인 전체)을 번역
+        0) 이전에 번역한 원문(캐시)과 배치 안의 중복 원문은 LLM 요청 대상에서 제외
+        1) 모든 원문을 마스킹한 뒤 RAG 컨텍스트를 한 번의 배치로 조회
+           (encode 1회 → FAISS 검색 1회)
+        2) 일본어가 있는 트윗을 최대 pack_size개(원문 합계 pack_chars자 이하)씩 묶어
+           묶음당 LLM 요청 1회로 번역
+           - 묶음들은 동시에 실행하되 진행 중인 LLM 호출 수는 concurrency개로 제한
+           - 묶음 응답을 파싱할 수 없으면 그 묶음만 트윗별 단건 번역으로 재시도
+           - 단건 번역도 실패하면 해당 트윗만 원문으로 대체
 
-        return TranslationResult(
-            translated=restored,
-            category="일반",
-            start=None,
-            end=None,
+        Args:
+            items: [(원문 텍스트, 타임스탬프), ...]
+            concurrency: 동시에 실행할 최대 번역 요청 수
+            pack_size: LLM 요청 1회에 묶을 최대 트윗 수
+            pack_chars: LLM 요청 1회에 묶을 원문(마스킹 후)의 최대 글자 수
+        Returns:
+            items와 같은 순서의 TranslationResult 목록
+        """
+        if not items:
+            return []
+
+        masks = [mask_all(text) for text, _ in items]
+        translated = [
+            TranslationResult(translated=text, category="일반", start=None, end=None)
+            for text, _ in items
+        ]
+
+        # 0) 일본어가 없는 트윗은 번역을 생략하므로 RAG 조회/LLM 요청 대상에서도 제외
+        #    캐시에 있는 원문은 바로 채우고, 배치 안에서 같은 원문은 첫 행만 번역
+        jp_rows: List[int] = []
+        first_row_by_text: Dict[str, int] = {}
+        duplicate_rows: List[Tuple[int, int]] = []  # (중복 행, 같은 원문의 첫 행)
+        for row, (masked, _, _) in enumerate(masks):
+            if not _JP.search(masked):
+                continue
+            text = items[row][0]
+            cached = self._cached_translation(text)
+            if cached is not None:
+                translated[row] = TranslationResult(
+                    translated=cached, category="일반", start=None, end=None
+                )
+            elif text in first_row_by_text:
+                duplicate_rows.append((row, first_row_by_text[text]))
+            else:
+                first_row_by_text[text] = row
+                jp_rows.append(row)
+
+        contexts = await asyncio.to_thread(
+            self.rag.get_contexts_batch, [masks[i][0] for i in jp_rows]
         )
+        context_by_row = dict(zip(jp_rows, contexts))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _translate_single(row: int) -> None:
+            text, timestamp = items[row]
+            try:
+                async with semaphore:
+                    translated[row] = await self.translate(text, timestamp, context_by_row[row])
+            except Exception as e:
+                logger.error("LLM 번역 실패, 원문으로 대체: %s", e)
+                return
+            self._cache_translation(text, translated[row].translated)
+
+        async def _translate_pack(rows: List[int]) -> None:
+            try:
+                async with semaphore:
+                    outputs = await self.run_chain(
+                        self.trans_chain.run_batch,
+                        [masks[row][0] for row in rows],
+                        [context_by_row[row] for row in rows],
+                    )
+            except Exception as e:
+                logger.warning("묶음 번역 실패, 단건 번역으로 재시도 (%d건): %s", len(rows), e)
+                await asyncio.gather(*(_translate_single(row) for row in rows))
+                return
+            for row, output in zip(rows, outputs):
+                _, rt_prefix, tag_mappings = masks[row]
+                restored = self._restore(output, rt_prefix, tag_mappings, extract_emojis(items[row][0]))
+                translated[row] = TranslationResult(
+                    translated=restored, category="일반", start=None, end=None
+                )
+                self._cache_translation(items[row][0], restored)
+
+        packs = _pack_rows(jp_rows, [len(masks[row][0]) for row in jp_rows], pack_size, pack_chars)
+        await asyncio.gather(*(_translate_pack(rows) for rows in packs))
+
+        # 배치 안의 중복 원문은 첫 행의 결과를 복사
+        for row, source_row in duplicate_rows:
+            translated[row] = translated[source_row].model_copy()
+        return translated
 
     async def classify(self, text: str) -> Tuple[str, Optional[str], Optional[str]]:
         """
         분류 및 제목/상세정보 추출
         """
-        raw = await asyncio.to_thread(self.class_chain.run, text)
-        parts = [p.strip() for p in raw.split("␞")]  # "카테고리␞제목␞상세정보"
-        if len(parts) != 3:
-            # 형식이 안 지켜지면 기본값 반환
-            return "일반", None, None
-        cat, title, desc = parts
+        raw = await self.run_chain(self.class_chain.run, text)
+        try:
+            # 1) JSON 모드 응답을 orjson으로 파싱 후 검증
+            result = ClassificationResult.model_validate(orjson.loads(raw))
+            cat, title, desc = result.category.strip(), result.title, result.description
+        except (orjson.JSONDecodeError, ValidationError):
+            # 2) 구형 "카테고리␞제목␞상세정보" 형식 응답 대비
+            parts = [p.strip() for p in raw.split("␞")]
+            if len(parts) != 3:
+                # 형식이 안 지켜지면 기본값 반환
+                return "일반", None, None
+            cat, title, desc = parts
         return (
             cat,
-            None if title.lower() == "none" else title,
-            None if desc.lower() == "none" else desc,
+            None if not title or title.lower() == "none" else title,
+            None if not desc or desc.lower() == "none" else desc,
         )
 
     async def extract_schedule(self, text: str, timestamp: str) -> Tuple[Optional[str], Optional[str]]:
         """
         일정(start, end) 정보 추출
         """
-        raw = await asyncio.to_thread(self.sched_chain.run, text, timestamp)
+        raw = await self.run_chain(self.sched_chain.run, text, timestamp)
         start, end = [s.strip() for s in raw.split("␞", 1)]
         return (
             None if start.lower() == "none" else start,
@@ -119,7 +303,7 @@ class LLMPipelineService:
         """
         자동 리플라이 생성
         """
-        reply_text = await asyncio.to_thread(
+        reply_text = await self.run_chain(
             self.reply_chain.run,
             text,
             contexts
@@ -1,8 +1,12 @@
-import json
+import sys
+import threading
 from enum import Enum
+from functools import lru_cache
 from typing import Dict
 from pathlib import Path
 
+import orjson
+
 class PromptType(str, Enum):
     TRANSLATE = "translate"
     CLASSIFY  = "classify"
@@ -66,11 +70,12 @@ Given tweet text (either in Japanese or translated Korean), carefully analyze th
 
 Consider the main purpose and focus of the tweet, not just keyword matches.
 
-Output format: 
-- If category is "일반": Output "일반 ␞ None ␞ None" (empty title and details)
-- For all other categories: Output "<카테고리> ␞ <제목> ␞ <상세정보>"
+Output format (JSON object only):
+- If category is "일반": {"category": "일반", "title": null, "description": null}
+- For all other categories: {"category": "<카테고리>", "title": "<제목>", "description": "<상세정보>"}
+- Examples may show the legacy "<카테고리> ␞ <제목> ␞ <상세정보>" notation; always answer with the JSON object instead.
 
-Output only this formatted response without explanations or additional text.
+Output only this JSON object without explanations or additional text.
 """,
     PromptType.SCHEDULE: """
 You are an AI scheduler. Your task is to extract broadcast date(s) and time(s) from Japanese/Korean text.
@@ -137,41 +142,75 @@ Output only the reply without explanations.
 """,
 }
 
-_few_shot_cache: dict[str, str] = {}
+# 여러 트윗을 한 번의 요청으로 번역할 때 user 메시지에 덧붙이는 출력 형식 지침
+# (system 프롬프트는 단건 번역과 동일하게 유지하여 prompt caching prefix를 공유)
+BATCH_TRANSLATE_INSTRUCTION = sys.intern("""
+The input below is a JSON array of tweets: [{"i": <index>, "text": <tweet>}, ...].
+Translate each "text" independently, following all the rules above.
+Output ONLY a JSON array with exactly one object per input tweet, in the same order:
+[{"i": <index>, "translated": <Korean translation>}, ...]
+""".strip())
+
+# 앞뒤 공백을 import 시점에 한 번만 제거하고 intern하여 프로세스 내 단일 객체로 공유
+SYSTEM_PROMPTS = {pt: sys.intern(body.strip()) for pt, body in SYSTEM_PROMPTS.items()}
+
+# few-shot 예시 파일 경로 (app/config/few_shot.json, import 시 한 번만 계산)
+_FEW_SHOT_PATH = Path(__file__).resolve().parents[2] / "config" / "few_shot.json"
+
+# PromptType별 few-shot 예시에서 사용하는 필드 (로드 시 이 순서의 튜플로 변환)
+_FEW_SHOT_FIELDS: Dict[PromptType, tuple[str, ...]] = {
+    PromptType.TRANSLATE: ("input", "output"),
+    PromptType.CLASSIFY:  ("text", "label"),
+    PromptType.SCHEDULE:  ("timestamp", "text", "label"),
+}
+
+_few_shot_cache: dict[str, tuple[tuple[str, ...], ...]] = {}
+_few_shot_lock = threading.Lock()
 
+def _load_few_shot() -> dict[str, tuple[tuple[str, ...], ...]]:
+    """
+    few_shot.json을 프로세스당 한 번만 로드
+    - 동시에 첫 호출이 들어와도 lock 안에서 한 스레드만 파일을 읽고 캐시를 채움
+    - 예시 dict는 로드 시점에 필드 순서의 튜플로 변환 (이후 위치 기반 접근)
+    """
+    global _few_shot_cache
+    with _few_shot_lock:
+        if not _few_shot_cache:
+            if not _FEW_SHOT_PATH.exists():
+                return {}
+            raw = orjson.loads(_FEW_SHOT_PATH.read_bytes())
+            _few_shot_cache = {
+                pt.value: tuple(
+                    tuple(ex[field] for field in fields)
+                    for ex in raw.get(pt.value, {}).get("examples", [])
+                )
+                for pt, fields in _FEW_SHOT_FIELDS.items()
+            }
+    return _few_shot_cache
+
+@lru_cache(maxsize=None)
 def get_few_shot_examples(pt: PromptType) -> str:
     """
     few-shot 예시를 파일에서 로드 -> 캐싱하여 반환
+    - 결과 문자열은 pt에만 의존하므로 PromptType별로 한 번만 생성(lru_cache)
     """
-    global _few_shot_cache
-    if not _few_shot_cache:
-        base_dir = Path(__file__).resolve().parent.parent.parent
-        path = base_dir / "config" / "few_shot.json"
-        if not path.exists():
-            return ""
-        with open(path, encoding="utf-8") as f:
-            _few_shot_cache = json.load(f)
-
-    entry = _few_shot_cache.get(pt.value, {})
+    examples = _load_few_shot().get(pt.value, ())
     if pt == PromptType.TRANSLATE:
-        examples = entry.get("examples", [])
-        lines = [f"입력:\n{ex['input']}\n출력:\n{ex['output']}" for ex in examples]
+        lines = [f"입력:\n{src}\n출력:\n{dst}" for src, dst in examples]
         return "\n\n".join(lines).strip()
 
     if pt == PromptType.CLASSIFY:
-        examples = entry.get("examples", [])
-        return "\n".join(f"{ex['text']} → {ex['label']}" for ex in examples).strip()
+        return "\n".join(f"{text} → {label}" for text, label in examples).strip()
 
     if pt == PromptType.SCHEDULE:
-        examples = entry.get("examples", [])
         blocks = [
             (
                 f"【예시】\n"
-                f"타임스탬프: {ex['timestamp']}\n"
-                f"텍스트: {ex['text']}\n"
-                f"출력: {ex['label']}"
+                f"타임스탬프: {timestamp}\n"
+                f"텍스트: {text}\n"
+                f"출력: {label}"
             )
-            for ex in examples
+            for timestamp, text, label in examples
         ]
         return "\n\n".join(blocks).strip()
 
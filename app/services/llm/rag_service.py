@@ -1,11 +1,24 @@
-import json
-from typing import List, Dict, Tuple
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, FrozenSet, Optional, Tuple
 
+import numpy as np
 import faiss
-from rank_bm25 import BM25Okapi
-from fugashi import Tagger
+import orjson
 from sentence_transformers import SentenceTransformer
 
+from app.services.llm.bm25_index import BM25Index, corpus_hash, tokenize_corpus, tokenize_ja
+from app.utils.embeddings import OnnxSentenceEmbedder, select_device
+
+logger = logging.getLogger(__name__)
+
+# Flat 인덱스를 HNSW로 변환하는 최소 벡터 수 (이보다 작으면 brute-force가 더 빠름)
+HNSW_MIN_VECTORS = 10_000
+HNSW_M = 32
+
 class RAGService:
     """
     RAG(검색 증강 생성) 서비스 클래스
@@ -18,81 +31,352 @@ class RAGService:
         meta_path: str,
         top_k: int = 15,
         lexical_weight: float = 0.7,
+        encode_batch_size: int = 32,
+        encode_cache_size: int = 1024,
+        nprobe: int = 16,
+        onnx_model_dir: Optional[str] = None,
+        bm25_path: Optional[str] = None,
+        semantic_cache_size: int = 1024,
+        semantic_cache_threshold: float = 0.95,
+        lsh_bits: int = 16,
+        context_cache_size: int = 10_000,
+        warmup: bool = True,
     ):
         # 1) FAISS 인덱스 로드 (semantic retrieval)
-        self.index = faiss.read_index(index_path)
+        self.index = self._tune_index(faiss.read_index(index_path), top_k, nprobe)
+        # 검색 점수를 cosine similarity로 그대로 쓰려면 정규화된 코퍼스 + inner-product 인덱스여야 함
+        if self.index.metric_type != faiss.METRIC_INNER_PRODUCT:
+            logger.warning(
+                "FAISS 인덱스가 inner-product가 아님(metric_type=%s) → build_faiss.py로 재생성 필요",
+                self.index.metric_type,
+            )
 
         # 2) 메타데이터 로드
-        with open(meta_path, encoding="utf-8") as f:
-            self.metadata: List[Dict[str, str]] = json.load(f)
-        self.source_texts = [entry["text"] for entry in self.metadata]
+        #    행별 dict를 유지하지 않고 원문/번역 두 리스트(SoA)로만 보관
+        with open(meta_path, "rb") as f:
+            rows: List[Dict[str, str]] = orjson.loads(f.read())
+        self.source_texts: List[str] = [row["text"] for row in rows]
+        self.translations: List[str] = [row["translation"] for row in rows]
+        del rows
 
-        # 3) 임베딩 모델 초기화
-        self.embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        # 3) 임베딩 모델 초기화 (ONNX INT8 모델이 지정되면 우선 사용, encode 시그니처 동일)
+        #    SentenceTransformer는 GPU(CUDA/MPS)가 있으면 GPU에 로드
+        if onnx_model_dir:
+            self.embedder = OnnxSentenceEmbedder(onnx_model_dir)
+        else:
+            self.embedder = SentenceTransformer(
+                "sentence-transformers/all-MiniLM-L6-v2",
+                device=select_device(),
+            )
 
-        # 4) 형태소 분석기 초기화
-        self.tagger = Tagger()
+        # 4) 형태소 분석기는 bm25_index의 스레드별 공유 Tagger(-Owakati) 사용
 
         # 5) BM25 인덱스 초기화
-        tokenized_corpus = [self._tokenize(text) for text in self.source_texts]
-        self.bm25 = BM25Okapi(tokenized_corpus)
+        #    build_faiss.py가 저장한 posting 배열이 있으면 그대로 로드 (코퍼스 재토큰화 생략)
+        #    메타데이터 해시가 다르면 오래된 파일로 보고 병렬 토큰화로 다시 생성한 뒤 저장
+        texts_hash = corpus_hash(self.source_texts)
+        self.bm25 = BM25Index.load(bm25_path) if bm25_path and os.path.exists(bm25_path) else None
+        if self.bm25 is None or self.bm25.corpus_hash != texts_hash:
+            self.bm25 = BM25Index.build(tokenize_corpus(self.source_texts), corpus_hash=texts_hash)
+            if bm25_path:
+                try:
+                    self.bm25.save(bm25_path)
+                except OSError as e:
+                    logger.warning("BM25 인덱스 저장 실패: %s", e)
 
         # 6) RAG 파라미터 저장
         self.top_k = top_k
         self.lexical_weight = lexical_weight
 
+        # 7) 쿼리 임베딩 LRU 캐시 (to_thread 호출이 겹칠 수 있으므로 lock으로 보호)
+        self.encode_batch_size = encode_batch_size
+        self._encode_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._encode_cache_size = encode_cache_size
+        self._encode_lock = threading.Lock()
+
+        # 8) 근사 중복 쿼리용 시맨틱 캐시 (random-projection LSH 버킷 → (쿼리 임베딩, BM25 토큰 집합, FAISS 결과))
+        #    같은 버킷이고 cosine ≥ threshold이며 토큰 집합까지 같을 때만 FAISS 검색 결과를 재사용
+        #    (고유명사 사전이므로 lexical 신호가 중요 → BM25는 항상 현재 쿼리로 계산)
+        rng = np.random.default_rng(0)
+        self._lsh_planes = rng.standard_normal((lsh_bits, self.index.d)).astype(np.float32)
+        self._lsh_weights = (1 << np.arange(lsh_bits, dtype=np.int64))
+        self._semantic_cache: "OrderedDict[int, Tuple[np.ndarray, FrozenSet[str], np.ndarray, np.ndarray]]" = OrderedDict()
+        self._semantic_cache_size = semantic_cache_size
+        self._semantic_cache_threshold = semantic_cache_threshold
+        self._semantic_lock = threading.Lock()
+
+        # 9) 완전히 같은 쿼리 텍스트용 결과 캐시 (리트윗/정형 공지 반복 → 임베딩 조회도 생략)
+        #    str 해시는 객체에 캐시되므로 별도 해시 함수 없이 텍스트를 그대로 키로 사용
+        self._context_cache: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._context_cache_size = context_cache_size
+        self._context_lock = threading.Lock()
+
+        # 10) FAISS 검색(GIL 해제)과 BM25 점수 계산을 겹쳐 실행하기 위한 lexical 전용 스레드
+        self._lexical_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-bm25")
+
+        # 11) 첫 요청 지연 방지를 위한 워밍업 (모델/ORT 세션/BLAS 커널/Tagger 초기화)
+        if warmup:
+            self._warmup()
+
+    def _warmup(self) -> None:
+        """
+        더미 쿼리로 임베딩 모델, FAISS 검색, BM25(lexical 스레드의 Tagger 포함)를 한 번씩 실행
+        - 쿼리 캐시에는 넣지 않도록 embedder/index를 직접 호출
+        """
+        query = "ウォームアップ"
+        self.embedder.encode([query], convert_to_numpy=True, normalize_embeddings=True)
+        if self.index.ntotal > 0:
+            self.index.search(np.zeros((1, self.index.d), dtype=np.float32), 1)
+        self._lexical_executor.submit(self._bm25_scores, [self._tokenize(query)]).result()
+
+    @staticmethod
+    def _tune_index(index: faiss.Index, top_k: int, nprobe: int) -> faiss.Index:
+        """
+        검색 파라미터 조정
+        - 대규모 Flat 인덱스(O(N·d) brute-force)는 HNSW 그래프 인덱스로 변환
+        - HNSW는 efSearch, IVF 계열(OPQ,IVF_HNSW,PQ 등)은 nprobe와 coarse quantizer efSearch 설정
+          (ParameterSpace는 OPQ 등 전처리 래퍼 안쪽의 인덱스까지 찾아서 설정)
+        """
+        if isinstance(index, faiss.IndexFlat) and index.ntotal > HNSW_MIN_VECTORS:
+            hnsw = faiss.IndexHNSWFlat(index.d, HNSW_M, index.metric_type)
+            hnsw.add(index.reconstruct_n(0, index.ntotal))
+            index = hnsw
+
+        ef_search = max(top_k * 4, 32)
+        params = faiss.ParameterSpace()
+        if isinstance(index, faiss.IndexHNSW):
+            params.set_index_parameter(index, "efSearch", ef_search)
+
+        ivf = faiss.try_extract_index_ivf(index)
+        if ivf is not None:
+            params.set_index_parameter(index, "nprobe", nprobe)
+            quantizer = faiss.downcast_index(ivf.quantizer)
+            if isinstance(quantizer, faiss.IndexHNSW):
+                quantizer.hnsw.efSearch = max(ef_search, nprobe)
+        return index
+
     def _tokenize(self, text: str) -> List[str]:
         """
-        일본어 형태소 단위로 토큰화
+        일본어 형태소 단위로 토큰화 (BM25 인덱스 빌드와 동일한 규칙)
+        """
+        return tokenize_ja(text)
+
+    def _encode(self, queries: List[str]) -> np.ndarray:
+        """
+        쿼리 목록을 한 번의 배치 forward로 임베딩하여 L2 정규화된 (len(queries), d) 행렬로 반환
+        - 최근 사용한 쿼리는 LRU 캐시에서 재사용하고, 캐시 미스만 모아서 encode
+        """
+        found: Dict[str, np.ndarray] = {}
+        with self._encode_lock:
+            for q in queries:
+                vec = self._encode_cache.get(q)
+                if vec is not None:
+                    self._encode_cache.move_to_end(q)
+                    found[q] = vec
+
+        misses = [q for q in dict.fromkeys(queries) if q not in found]
+        if misses:
+            embeddings = self.embedder.encode(
+                misses,
+                batch_size=self.encode_batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            ).astype(np.float32)
+            with self._encode_lock:
+                for q, vec in zip(misses, embeddings):
+                    found[q] = vec
+                    self._encode_cache[q] = vec
+                while len(self._encode_cache) > self._encode_cache_size:
+                    self._encode_cache.popitem(last=False)
+
+        return np.stack([found[q] for q in queries])
+
+    def _lsh_keys(self, embeddings: np.ndarray) -> List[int]:
+        """
+        임베딩 행렬의 각 행을 random hyperplane 부호 비트로 해시하여 버킷 키 목록으로 반환
+        """
+        bits = (embeddings @ self._lsh_planes.T) > 0
+        return (bits @ self._lsh_weights).tolist()
+
+    def _semantic_cache_get(
+        self, key: int, vec: np.ndarray, token_set: FrozenSet[str]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        같은 LSH 버킷의 캐시 항목이 충분히 유사하고(cosine ≥ threshold) BM25 토큰 집합이 같으면
+        FAISS 검색 결과(sims, indices)를 반환
+        """
+        with self._semantic_lock:
+            entry = self._semantic_cache.get(key)
+            if entry is None:
+                return None
+            cached_vec, cached_tokens, sims, indices = entry
+            if cached_tokens != token_set:
+                return None
+            if float(np.dot(vec, cached_vec)) < self._semantic_cache_threshold:
+                return None
+            self._semantic_cache.move_to_end(key)
+            return sims, indices
+
+    def _semantic_cache_put(
+        self,
+        key: int,
+        vec: np.ndarray,
+        token_set: FrozenSet[str],
+        sims: np.ndarray,
+        indices: np.ndarray,
+    ) -> None:
+        """
+        FAISS 검색 결과를 LSH 버킷에 저장하고 용량을 넘으면 가장 오래된 항목부터 제거
+        """
+        with self._semantic_lock:
+            self._semantic_cache[key] = (vec, token_set, sims, indices)
+            self._semantic_cache.move_to_end(key)
+            while len(self._semantic_cache) > self._semantic_cache_size:
+                self._semantic_cache.popitem(last=False)
+
+    def _context_cache_get(self, queries: List[str]) -> List[Optional[List[int]]]:
+        """
+        쿼리 텍스트별로 캐시된 선택 인덱스를 반환 (없으면 None)
         """
-        return [word.surface for word in self.tagger(text)]
+        results: List[Optional[List[int]]] = []
+        with self._context_lock:
+            for q in queries:
+                selected = self._context_cache.get(q)
+                if selected is not None:
+                    self._context_cache.move_to_end(q)
+                results.append(selected)
+        return results
+
+    def _context_cache_put(self, queries: List[str], selected_list: List[List[int]]) -> None:
+        """
+        쿼리 텍스트별 선택 인덱스를 저장하고 용량을 넘으면 가장 오래된 항목부터 제거
+        """
+        with self._context_lock:
+            for q, selected in zip(queries, selected_list):
+                self._context_cache[q] = selected
+                self._context_cache.move_to_end(q)
+            while len(self._context_cache) > self._context_cache_size:
+                self._context_cache.popitem(last=False)
+
+    def _bm25_scores(self, tokens_list: List[List[str]]) -> List[np.ndarray]:
+        """
+        Lexical 검색: 토큰화된 쿼리별 BM25 점수 (n_docs,) 목록 계산
+        """
+        return [self.bm25.get_scores(tokens) for tokens in tokens_list]
+
+    def _rank(self, bm25_scores: np.ndarray, sims: np.ndarray, indices: np.ndarray) -> List[int]:
+        """
+        한 쿼리의 FAISS 검색 결과(sims, indices)와 BM25 점수를 결합하여 상위 top_k 인덱스를 반환
+        - 모든 점수를 문서 수(N) 길이의 ndarray로 다루므로 후보 집합(set)/점수 dict가 필요 없음
+          (semantic 검색에 없는 문서는 semantic 점수 0 → 합집합이 암묵적으로 처리됨)
+        """
+        n_docs = len(self.source_texts)
+        valid = (indices >= 0) & (indices < n_docs)
+        sem_idx, sem_sims = indices[valid], sims[valid]
+
+        # 3) BM25 점수 정규화 계수
+        max_bm = float(bm25_scores.max()) if bm25_scores.size > 0 else 0.0
+
+        # 4) lexical 매치가 전혀 없고 semantic 결과가 모두 양수이면
+        #    FAISS 결과(이미 유사도 내림차순)가 그대로 최종 순위 → N 길이 연산 생략
+        if max_bm <= 0 and sem_idx.size >= self.top_k and (sem_sims > 0).all():
+            return sem_idx[: self.top_k].tolist()
+
+        # 5) combined score를 버퍼 하나에서 in-place로 계산 → 상위 top_k 선택
+        #    (코퍼스/쿼리 모두 L2 정규화 + inner-product 인덱스 → sims가 곧 cosine similarity)
+        if max_bm > 0:
+            combined = bm25_scores.astype(np.float32, copy=True)
+            combined *= self.lexical_weight / max_bm
+        else:
+            combined = np.zeros(n_docs, dtype=np.float32)
+        combined[sem_idx] += sem_sims
+        return self._top_k(combined, self.top_k)
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> List[int]:
+        """
+        점수 배열에서 상위 k개 인덱스를 점수 내림차순으로 반환
+        - 전체 정렬(O(N log N)) 대신 argpartition(O(N)) 후 k개만 정렬
+        - 선택된 k개 안의 동점은 인덱스 오름차순으로 정렬
+        """
+        k = min(k, scores.size)
+        if k <= 0:
+            return []
+        if k < scores.size:
+            top = np.sort(np.argpartition(-scores, k - 1)[:k])
+        else:
+            # 코퍼스가 top_k 이하이면 partition 없이 전체를 정렬
+            top = np.arange(scores.size)
+        return top[np.argsort(-scores[top], kind="stable")].tolist()
+
+    def _format(self, selected: List[int]) -> List[str]:
+        """
+        선택된 인덱스를 “원문 → 번역” 컨텍스트 문자열 목록으로 변환
+        """
+        return [
+            f"{self.source_texts[i]} → {self.translations[i]}"
+            for i in selected
+        ]
 
     def get_context(self, query: str) -> List[str]:
         """
         주어진 쿼리에 대해 semantic + lexical 검색을 결합하여 상위 top_k개의 "원문 → 번역" 컨텍스트 목록을 반환
         """
-        # 1) Semantic 검색: FAISS cosine similarity 검색
-        query_embedding = self.embedder.encode([query])
-        sims, indices = self.index.search(query_embedding, self.top_k)
-        sims = sims[0]  # inner-product 값 == cosine similarity (L2-normalized vectors)
-        semantic_indices = [int(i) for i in indices[0] if 0 <= i < len(self.source_texts)]
-
-        # 2) Lexical 검색: BM25 점수 계산
-        tokenized_query = self._tokenize(query)
-        bm25_scores = self.bm25.get_scores(tokenized_query)
-        top_lex_indices = sorted(
-            range(len(bm25_scores)),
-            key=lambda i: bm25_scores[i],
-            reverse=True
-        )[: self.top_k]
-
-        # 3) 후보 인덱스 집합
-        candidate_indices = set(semantic_indices) | set(top_lex_indices)
-
-        # 4) Semantic similarity 정규화
-        max_sim = float(sims.max()) if sims.size > 0 else 1.0
-        sem_score_map: Dict[int, float] = {
-            semantic_indices[i]: sims[i] / max_sim
-            for i in range(len(semantic_indices))
-        }
-
-        # 5) BM25 점수 정규화
-        max_bm = float(bm25_scores.max()) if bm25_scores.size > 0 else 1.0
-
-        # 6) combined score 계산
-        combined_scores: List[Tuple[int, float]] = []
-        for idx in candidate_indices:
-            sem_sc = sem_score_map.get(idx, 0.0)
-            lex_sc = (bm25_scores[idx] / max_bm) if max_bm > 0 else 0.0
-            total_sc = sem_sc + self.lexical_weight * lex_sc
-            combined_scores.append((idx, total_sc))
-
-        # 7) 상위 top_k 선택
-        combined_scores.sort(key=lambda x: x[1], reverse=True)
-        selected = [idx for idx, _ in combined_scores[: self.top_k]]
-
-        # 8) “원문 → 번역” 컨텍스트 반환
+        return self.get_contexts_batch([query])[0]
+
+    def get_contexts_batch(self, queries: List[str]) -> List[List[str]]:
+        """
+        여러 쿼리(예: 타임라인 전체)의 컨텍스트를 한 번에 계산
+        0) 같은 텍스트로 조회한 적이 있으면 임베딩/검색 없이 이전 결과 재사용
+        1) 나머지 쿼리를 한 번의 encode 배치로 임베딩
+        2) 시맨틱 캐시 미스만 모아서 FAISS 검색을 (n, d) 행렬 한 번으로 수행
+        3) 모든 쿼리의 BM25 점수와 결합 후 “원문 → 번역” 목록 반환
+        """
+        if not queries:
+            return []
+
+        # 0) 텍스트 완전 일치 캐시 조회
+        cached = self._context_cache_get(queries)
+        pending = [row for row, selected in enumerate(cached) if selected is None]
+        if pending:
+            pending_queries = [queries[row] for row in pending]
+            selected_list = self._search(pending_queries)
+            self._context_cache_put(pending_queries, selected_list)
+            for row, selected in zip(pending, selected_list):
+                cached[row] = selected
+
+        return [self._format(selected) for selected in cached]
+
+    def _search(self, queries: List[str]) -> List[List[int]]:
+        """
+        쿼리 목록의 선택 인덱스(top_k) 목록을 계산 (FAISS(시맨틱 캐시) + BM25)
+        """
+        # 1) 쿼리 토큰화 후 BM25는 캐시 여부와 무관하게 항상 별도 스레드에서 계산
+        tokens_list = [self._tokenize(query) for query in queries]
+        lexical = self._lexical_executor.submit(self._bm25_scores, tokens_list)
+
+        # 2) 쿼리 임베딩 후 시맨틱 캐시 조회 (근사 중복 + 같은 토큰 집합이면 FAISS 결과만 재사용)
+        query_embeddings = self._encode(queries)
+        keys = self._lsh_keys(query_embeddings)
+        token_sets = [frozenset(tokens) for tokens in tokens_list]
+        hits: List[Optional[Tuple[np.ndarray, np.ndarray]]] = [
+            self._semantic_cache_get(key, vec, token_set)
+            for key, vec, token_set in zip(keys, query_embeddings, token_sets)
+        ]
+
+        # 3) 캐시 미스만 FAISS cosine similarity 배치 검색 (L2 정규화된 쿼리 임베딩)
+        miss_rows = [row for row, hit in enumerate(hits) if hit is None]
+        if miss_rows:
+            sims, indices = self.index.search(query_embeddings[miss_rows], self.top_k)
+            for i, row in enumerate(miss_rows):
+                self._semantic_cache_put(
+                    keys[row], query_embeddings[row], token_sets[row], sims[i], indices[i]
+                )
+                hits[row] = (sims[i], indices[i])
+
+        # 4) 쿼리별 BM25 점수와 결합
+        bm25_batch = lexical.result()
         return [
-            f"{self.metadata[i]['text']} → {self.metadata[i]['translation']}"
-            for i in selected
-        ]
\ No newline at end of file
+            self._rank(bm25_scores, sims, indices)
+            for bm25_scores, (sims, indices) in zip(bm25_batch, hits)
+        ]
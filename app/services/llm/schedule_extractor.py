@@ -0,0 +1,134 @@
+import re
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+# ─── 상수 정의 ─────────────────────────────────────────────────────
+# 참조 타임스탬프 형식 (twitter_service / pipeline에서 넘겨주는 형식)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# TIMESTAMP_FORMAT 문자열 길이 ("YYYY-MM-DD HH:MM:SS")
+_TIMESTAMP_LEN = 19
+# 출력 형식 (ScheduleChain LLM 응답과 동일)
+OUTPUT_FORMAT = "%Y.%m.%d %H:%M:%S"
+# 방송 업계 표기(24:00 ~ 29:59 → 다음날 00:00 ~ 05:59)까지 허용
+MAX_OVERFLOW_HOUR = 29
+# 시각이 하나뿐일 때 가정하는 방송 길이
+DEFAULT_DURATION = timedelta(hours=1)
+
+# 22:30, 28:00
+_CLOCK_RE = re.compile(r"(?<!\d)(午前|午後)?(\d{1,2})[:：](\d{2})(?!\d)")
+# 22時, 15時30分, 午後10時半 (1時間, 24時間 같은 길이 표현은 제외)
+_KANJI_TIME_RE = re.compile(r"(?<!\d)(午前|午後)?(\d{1,2})時(?!間)(?:(\d{1,2})分|(半))?")
+# 6/2, 6月2日
+_DATE_RE = re.compile(r"(?<!\d)(\d{1,2})(?:/|月)(\d{1,2})日?(?!\d)")
+
+# 상대 날짜 표현 → 참조일 기준 일수
+_RELATIVE_DAYS = (
+    ("明後日", 2),
+    ("あさって", 2),
+    ("明日", 1),
+    ("あした", 1),
+    ("今夜", 0),
+    ("今日", 0),
+)
+
+
+def _to_minutes(meridiem: Optional[str], hour: int, minute: int) -> Optional[int]:
+    """
+    (오전/오후, 시, 분)을 기준일 00:00부터의 분 단위 오프셋으로 변환
+    - 午前12時는 00:00, 午後12時는 12:00
+    - 24시 이상(방송 표기)은 그대로 유지하여 다음날로 넘어가게 함
+    - 범위를 벗어나면 None
+    """
+    if meridiem == "午前" and hour == 12:
+        hour = 0
+    elif meridiem == "午後" and hour < 12:
+        hour += 12
+    if hour > MAX_OVERFLOW_HOUR or minute > 59:
+        return None
+    return hour * 60 + minute
+
+
+def _find_times(text: str) -> List[int]:
+    """
+    텍스트에서 모든 시각 표현을 찾아 등장 순서대로 분 단위 오프셋 목록으로 반환
+    """
+    found: List[Tuple[int, int]] = []
+    for match in _CLOCK_RE.finditer(text):
+        meridiem, hour, minute = match.groups()
+        value = _to_minutes(meridiem, int(hour), int(minute))
+        if value is not None:
+            found.append((match.start(), value))
+    for match in _KANJI_TIME_RE.finditer(text):
+        meridiem, hour, minute, half = match.groups()
+        value = _to_minutes(meridiem, int(hour), 30 if half else int(minute or 0))
+        if value is not None:
+            found.append((match.start(), value))
+    found.sort()
+    return [value for _, value in found]
+
+
+def _find_base_date(text: str, reference: datetime) -> Optional[datetime]:
+    """
+    방송 기준일 결정
+    1) 명시적 날짜(6/2, 6月2日)가 있으면 참조 연도로 사용 (참조일보다 이전이면 다음 해)
+    2) 상대 날짜(今日/明日 등)가 있으면 참조일에서 이동
+    3) 날짜 단서가 없으면 None
+    """
+    base = reference.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    match = _DATE_RE.search(text)
+    if match:
+        month, day = int(match.group(1)), int(match.group(2))
+        try:
+            date = base.replace(month=month, day=day)
+            if date < base:
+                date = date.replace(year=base.year + 1)
+            return date
+        except ValueError:
+            pass
+
+    for word, days in _RELATIVE_DAYS:
+        if word in text:
+            return base + timedelta(days=days)
+    return None
+
+
+def extract_schedule(text: str, timestamp: str) -> Optional[Tuple[str, str]]:
+    """
+    일본어 방송 공지 텍스트에서 (start, end) 일시를 규칙 기반으로 추출
+    - 날짜 단서(명시적 날짜 또는 今日/明日 등)와 시각이 모두 있는 경우에만 추출
+    - 처음 등장한 시각을 start, 그 다음 시각을 end로 사용 (end가 더 이르면 다음날)
+    - 시각이 하나뿐이면 1시간 방송으로 가정
+    - 24:00 이상은 다음날로 변환 (28:30 → 다음날 04:30)
+
+    Returns:
+        ("YYYY.MM.DD HH:MM:SS", "YYYY.MM.DD HH:MM:SS")
+        시각 또는 날짜 단서를 찾지 못했거나 timestamp 형식이 다르면 None (호출 측에서 LLM으로 폴백)
+    """
+    try:
+        # TIMESTAMP_FORMAT은 ISO 8601 형식이므로 strptime(포맷 문자열 해석) 대신 C 구현 fromisoformat 사용
+        # (길이 검사로 날짜만 있는 문자열 등 다른 ISO 형태는 기존처럼 거부)
+        if len(timestamp) != _TIMESTAMP_LEN or timestamp[10] != " ":
+            return None
+        reference = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return None
+
+    offsets = _find_times(text)
+    if not offsets:
+        return None
+
+    base = _find_base_date(text, reference)
+    if base is None:
+        return None
+
+    start = base + timedelta(minutes=offsets[0])
+    if len(offsets) == 1:
+        end = start + DEFAULT_DURATION
+    else:
+        end = base + timedelta(minutes=offsets[1])
+        if end < start:
+            end += timedelta(days=1)
+        elif end == start:
+            end = start + DEFAULT_DURATION
+    return start.strftime(OUTPUT_FORMAT), end.strftime(OUTPUT_FORMAT)
@@ -29,6 +29,12 @@ class TextMasker:
         r"#([A-Za-z0-9_가-힣\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]+)"
     )
 
+    # RT 접두사 + 해시태그를 한 번의 스캔으로 찾는 결합 패턴 (mask_all 전용)
+    COMBINED_PATTERN = re.compile(
+        r"(?P<rt>^RT @[\w]+:\s*)"
+        r"|(?P<tag>#[A-Za-z0-9_가-힣\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]+)"
+    )
+
     # 이모지 추출 범위
     EMOJI_PATTERN = re.compile(
         r"[\U0001F300-\U0001F6FF"  # 기타 픽토그램
@@ -48,8 +54,8 @@ class TextMasker:
             return text, None
 
         prefix = match.group(0)  # ex) "RT @cocona_nonaka: "
-        masked = text.replace(prefix, f"{cls.RT_TOKEN} ", 1)
-        logger.debug(f"RT 마스킹: {prefix} -> {cls.RT_TOKEN}")
+        masked = f"{cls.RT_TOKEN} {text[match.end():]}"
+        logger.debug("RT 마스킹: %s -> %s", prefix, cls.RT_TOKEN)
         return masked, prefix
 
     @classmethod
@@ -61,7 +67,7 @@ class TextMasker:
             return text
 
         restored = text.replace(f"{cls.RT_TOKEN} ", original_prefix, 1)
-        logger.debug(f"RT 복원: {cls.RT_TOKEN} -> {original_prefix}")
+        logger.debug("RT 복원: %s -> %s", cls.RT_TOKEN, original_prefix)
         return restored
 
     @classmethod
@@ -72,26 +78,20 @@ class TextMasker:
         플레이스홀더 형태: 【HASHTAG_001】
         - 반환값: (마스킹된 텍스트, [(플레이스홀더, "#원본태그"), ...])
         """
-        # 1) 원문에서 해시태그 전체 조회
-        hashtags = cls.HASHTAG_PATTERN.findall(text)
-        if not hashtags:
-            return text, []
-
-        masked = text
         tag_mappings: List[Tuple[str, str]] = []
 
-        for idx, body in enumerate(hashtags):
-            full_tag = f"#{body}"
-
-            # 간단한 인덱스 기반 플레이스홀더
-            placeholder = f"{cls.HASH_PLACEHOLDER_PREFIX}{idx + 1:03d}{cls.HASH_PLACEHOLDER_SUFFIX}"
-
-            # 발견되는 첫 번째 full_tag만 플레이스홀더로 치환
-            if full_tag in masked:
-                masked = masked.replace(full_tag, placeholder, 1)
-                tag_mappings.append((placeholder, full_tag))
-                logger.debug(f"해시태그 마스킹: {full_tag} -> {placeholder}")
-
+        def _repl(match: re.Match) -> str:
+            # 등장 순서대로 인덱스 기반 플레이스홀더 부여
+            full_tag = match.group(0)
+            placeholder = (
+                f"{cls.HASH_PLACEHOLDER_PREFIX}{len(tag_mappings) + 1:03d}{cls.HASH_PLACEHOLDER_SUFFIX}"
+            )
+            tag_mappings.append((placeholder, full_tag))
+            logger.debug("해시태그 마스킹: %s -> %s", full_tag, placeholder)
+            return placeholder
+
+        # 원문을 한 번만 스캔하며 해시태그를 플레이스홀더로 치환
+        masked = cls.HASHTAG_PATTERN.sub(_repl, text)
         return masked, tag_mappings
 
     @classmethod
@@ -104,9 +104,9 @@ class TextMasker:
         for placeholder, original_tag in tag_mappings:
             if placeholder in restored:
                 restored = restored.replace(placeholder, original_tag, 1)
-                logger.debug(f"해시태그 복원 성공: {placeholder} -> {original_tag}")
+                logger.debug("해시태그 복원 성공: %s -> %s", placeholder, original_tag)
             else:
-                logger.warning(f"플레이스홀더를 찾을 수 없음: {placeholder}")
+                logger.warning("플레이스홀더를 찾을 수 없음: %s", placeholder)
 
                 # 가능한 변형된 형태들을 확인
                 # LLM이 【】를 다른 기호로 바꿨을 가능성
@@ -122,7 +122,7 @@ class TextMasker:
                 for form in potential_forms:
                     if form in restored:
                         restored = restored.replace(form, original_tag, 1)
-                        logger.info(f"변형된 플레이스홀더 복원: {form} -> {original_tag}")
+                        logger.info("변형된 플레이스홀더 복원: %s -> %s", form, original_tag)
                         found = True
                         break
 
@@ -137,96 +137,69 @@ class TextMasker:
                         for remnant in possible_remnants:
                             if remnant in restored:
                                 restored = restored.replace(remnant, original_tag, 1)
-                                logger.info(f"부분 매칭으로 복원: {remnant} -> {original_tag}")
+                                logger.info("부분 매칭으로 복원: %s -> %s", remnant, original_tag)
                                 found = True
                                 break
 
                 if not found:
-                    logger.error(f"해시태그 복원 완전 실패: {placeholder} -> {original_tag}")
+                    logger.error("해시태그 복원 완전 실패: %s -> %s", placeholder, original_tag)
                     # 최후의 수단: 원본 태그를 텍스트 끝에 추가
                     restored += f" {original_tag}"
-                    logger.info(f"해시태그를 텍스트 끝에 추가: {original_tag}")
+                    logger.info("해시태그를 텍스트 끝에 추가: %s", original_tag)
 
         return restored
 
     @classmethod
-    def extract_emojis(cls, text: str) -> List[str]:
-        """
-        텍스트 내 모든 이모지(Unicode 영역)를 리스트로 추출
+    def mask_all(cls, text: str) -> Tuple[str, Optional[str], List[Tuple[str, str]]]:
         """
-        return cls.EMOJI_PATTERN.findall(text)
-
-class TextMaskerStatic:
-    """
-    정적 메서드 버전 - 타입 힌트 오류 완전 해결
-    """
-
-    # 클래스 상수들
-    RT_TOKEN = "【RTMASK】"
-    HASH_PLACEHOLDER_PREFIX = "【HASHTAG_"
-    HASH_PLACEHOLDER_SUFFIX = "】"
-    RT_PATTERN = re.compile(r"^RT @[\w]+:\s*")
-    HASHTAG_PATTERN = re.compile(r"#([A-Za-z0-9_가-힣\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]+)")
-    EMOJI_PATTERN = re.compile(r"[\U0001F300-\U0001F6FF\U0001F900-\U0001F9FF\u2600-\u26FF\u2700-\u27BF]")
-
-    @staticmethod
-    def mask_rt_prefix(text: str) -> Tuple[str, Optional[str]]:
-        """RT 접두사 마스킹 (정적 메서드)"""
-        match = TextMaskerStatic.RT_PATTERN.match(text)
-        if not match:
-            return text, None
-
-        prefix = match.group(0)
-        masked = text.replace(prefix, f"{TextMaskerStatic.RT_TOKEN} ", 1)
-        logger.debug(f"RT 마스킹: {prefix} -> {TextMaskerStatic.RT_TOKEN}")
-        return masked, prefix
+        RT 접두사와 해시태그를 한 번의 스캔으로 마스킹
+        (mask_hashtags → mask_rt_prefix를 차례로 호출한 것과 같은 결과)
 
-    @staticmethod
-    def restore_rt_prefix(text: str, original_prefix: Optional[str]) -> str:
-        """RT 접두사 복원 (정적 메서드)"""
-        if not original_prefix:
-            return text
-
-        restored = text.replace(f"{TextMaskerStatic.RT_TOKEN} ", original_prefix, 1)
-        logger.debug(f"RT 복원: {TextMaskerStatic.RT_TOKEN} -> {original_prefix}")
-        return restored
-
-    @staticmethod
-    def mask_hashtags(text: str) -> Tuple[str, List[Tuple[str, str]]]:
-        """해시태그 마스킹 (정적 메서드)"""
-        hashtags = TextMaskerStatic.HASHTAG_PATTERN.findall(text)
-        if not hashtags:
-            return text, []
-
-        masked = text
+        - 반환값: (마스킹된 텍스트, 원본 RT prefix 또는 None, [(플레이스홀더, "#원본태그"), ...])
+        """
+        rt_prefix: Optional[str] = None
         tag_mappings: List[Tuple[str, str]] = []
 
-        for idx, body in enumerate(hashtags):
-            full_tag = f"#{body}"
-            placeholder = f"{TextMaskerStatic.HASH_PLACEHOLDER_PREFIX}{idx + 1:03d}{TextMaskerStatic.HASH_PLACEHOLDER_SUFFIX}"
+        def _repl(match: re.Match) -> str:
+            nonlocal rt_prefix
+            if match.group("rt"):
+                rt_prefix = match.group(0)
+                logger.debug("RT 마스킹: %s -> %s", rt_prefix, cls.RT_TOKEN)
+                return f"{cls.RT_TOKEN} "
 
-            if full_tag in masked:
-                masked = masked.replace(full_tag, placeholder, 1)
-                tag_mappings.append((placeholder, full_tag))
-                logger.debug(f"해시태그 마스킹: {full_tag} -> {placeholder}")
+            full_tag = match.group(0)
+            placeholder = (
+                f"{cls.HASH_PLACEHOLDER_PREFIX}{len(tag_mappings) + 1:03d}{cls.HASH_PLACEHOLDER_SUFFIX}"
+            )
+            tag_mappings.append((placeholder, full_tag))
+            logger.debug("해시태그 마스킹: %s -> %s", full_tag, placeholder)
+            return placeholder
 
-        return masked, tag_mappings
+        masked = cls.COMBINED_PATTERN.sub(_repl, text)
+        return masked, rt_prefix, tag_mappings
 
-    @staticmethod
-    def restore_hashtags(text: str, tag_mappings: List[Tuple[str, str]]) -> str:
-        """해시태그 복원 (정적 메서드)"""
-        restored = text
+    @classmethod
+    def restore_all(
+        cls,
+        text: str,
+        rt_prefix: Optional[str],
+        tag_mappings: List[Tuple[str, str]],
+    ) -> str:
+        """
+        mask_all로 마스킹한 RT 접두사와 해시태그를 원본으로 복원
+        """
+        return cls.restore_hashtags(cls.restore_rt_prefix(text, rt_prefix), tag_mappings)
 
-        for placeholder, original_tag in tag_mappings:
-            if placeholder in restored:
-                restored = restored.replace(placeholder, original_tag, 1)
-                logger.debug(f"해시태그 복원 성공: {placeholder} -> {original_tag}")
-            else:
-                logger.warning(f"플레이스홀더를 찾을 수 없음: {placeholder}")
+    @classmethod
+    def extract_emojis(cls, text: str) -> List[str]:
+        """
+        텍스트 내 모든 이모지(Unicode 영역)를 리스트로 추출
+        - ASCII만으로 된 텍스트는 이모지가 있을 수 없으므로 정규식 스캔 생략 (str.isascii는 문자열 내부 플래그만 확인하는 O(1) 연산)
+        """
+        if text.isascii():
+            return []
+        return cls.EMOJI_PATTERN.findall(text)
 
-        return restored
 
-    @staticmethod
-    def extract_emojis(text: str) -> List[str]:
-        """이모지 추출 (정적 메서드)"""
-        return TextMaskerStatic.EMOJI_PATTERN.findall(text)
\ No newline at end of file
+# 이전 정적 메서드 버전과의 호환용 별칭 (classmethod는 클래스에서 직접 호출 가능하므로 동작 동일)
+TextMaskerStatic = TextMasker
@@ -1,8 +1,8 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.schedule import Schedule
@@ -12,6 +12,9 @@ from app.utils.exceptions import BadRequestError, UnauthorizedError
 
 logger = logging.getLogger(__name__)
 
+# 오시 일정 스트리밍 조회 시 DB 드라이버에서 한 번에 가져올 행 수
+SCHEDULE_STREAM_BATCH_SIZE = 200
+
 class ScheduleService:
     """
     일정 관리 서비스 클래스
@@ -36,13 +39,13 @@ class ScheduleService:
         """
         if not self.twitter_svc:
             raise BadRequestError("트위터 서비스가 설정되어 있지 않습니다.")
-        logger.debug(f"Resolving internal ID for screen_name={screen_name}")
+        logger.debug("Resolving internal ID for screen_name=%s", screen_name)
 
         # 트위터 내부 id 조회
         internal_id = await self.twitter_svc.get_user_id(screen_name)
         if not internal_id:
             raise BadRequestError(f"트위터 유저를 찾을 수 없습니다: {screen_name}")
-        logger.debug(f"Resolved internal ID: {internal_id}")
+        logger.debug("Resolved internal ID: %s", internal_id)
         return internal_id
 
     async def create_schedule(
@@ -103,7 +106,7 @@ class ScheduleService:
         2) 생성자(user_id)와 요청자(user_id) 일치 확인 (아니면 UnauthorizedError)
         3) 시간이 주어졌다면 유효성 재검증
         4) 관련 트위터 사용자 변경 시 내부 ID 재조회
-        5) 각 필드별로 유효하면 변경 → commit → refresh → 반환
+        5) None이 아닌 필드만 변경 → commit → 반환
         """
         # 1) 일정 조회
         sched = await self.db.get(Schedule, schedule_id)
@@ -124,58 +127,66 @@ class ScheduleService:
                 related_twitter_screen_name
             )
 
-        # 5) 각 필드에 변경된 값 적용
-        if title:
-            sched.title = title
-        if category:
-            sched.category = category
-        if start_at:
-            sched.start_at = start_at
-        if end_at:
-            sched.end_at = end_at
-        if description:
-            sched.description = description
-
-        # 6) 변경 사항 커밋 및 최신 상태 반영
-        self.db.add(sched)
+        # 5) 각 필드에 변경된 값 적용 (None만 "변경 없음"으로 보고 빈 문자열은 그대로 반영)
+        updates = {
+            "title": title,
+            "category": category,
+            "start_at": start_at,
+            "end_at": end_at,
+            "description": description,
+        }
+        for field, value in updates.items():
+            if value is not None:
+                setattr(sched, field, value)
+
+        # 6) 변경 사항 커밋
+        #    sched는 db.get으로 읽어 세션이 이미 추적 중이므로 add 없이 commit만으로 flush
+        #    expire_on_commit=False라 컬럼 값은 그대로 유효 → 관련 트위터 사용자가 바뀐 경우에만
+        #    related_twitter_user 관계를 다시 로드
         await self.db.commit()
-        await self.db.refresh(sched)
+        if related_twitter_screen_name:
+            await self.db.refresh(sched, attribute_names=["related_twitter_user"])
         return sched
 
     async def delete_schedule(self, schedule_id: int, user_id: int) -> None:
         """
         일정 삭제
-        1) Schedule 조회 (없으면 BadRequestError)
-        2) 생성자와 요청자(user_id) 일치 확인 (아니면 UnauthorizedError)
-        3) delete → commit
+        1) id + 생성자(user_id) 조건으로 DELETE 한 번 실행 → commit
+        2) 삭제된 행이 없을 때만 일정 존재 여부를 조회하여 예외 구분
+           (없으면 BadRequestError, 다른 유저의 일정이면 UnauthorizedError)
         """
-        sched = await self.db.get(Schedule, schedule_id)
-        if not sched:
-            raise BadRequestError(f"일정 ID {schedule_id}를 찾을 수 없습니다.")
-        if sched.created_by_user_id != user_id:
-            raise UnauthorizedError("삭제 권한이 없습니다.")
-
-        await self.db.delete(sched)
+        # 1) 소유권 조건을 포함한 단일 DELETE
+        result = await self.db.execute(
+            delete(Schedule).where(
+                Schedule.id == schedule_id,
+                Schedule.created_by_user_id == user_id,
+            )
+        )
         await self.db.commit()
 
-    async def list_my_oshi_schedules(self, user_id: int) -> List[Schedule]:
+        # 2) 실패 원인 구분
+        if result.rowcount == 0:
+            exists = await self.db.scalar(
+                select(Schedule.id).where(Schedule.id == schedule_id)
+            )
+            if exists is None:
+                raise BadRequestError(f"일정 ID {schedule_id}를 찾을 수 없습니다.")
+            raise UnauthorizedError("삭제 권한이 없습니다.")
+
+    async def list_my_oshi_schedules(self, user_id: int) -> AsyncIterator[Schedule]:
         """
         오시 일정 조회
-        1) UserOshi 테이블에서 해당 유저의 oshi_internal_id 조회
-        2) 관련된 Schedule 모두 조회하여 시작 시간 기준 정렬 후 반환
+        - UserOshi와 JOIN하여 유저의 오시 관련 Schedule을 한 번의 쿼리로 조회 (시작 시간 기준 정렬)
+        - 전체 결과를 리스트로 만들지 않고 SCHEDULE_STREAM_BATCH_SIZE개씩 가져오며 하나씩 yield
+        - 오시가 없으면 INNER JOIN 결과가 비어 있으므로 아무것도 yield하지 않음
         """
-        # 1) UserOshi 조회
-        user_oshi_query = select(UserOshi).where(UserOshi.user_id == user_id)
-        user_oshi_result = await self.db.execute(user_oshi_query)
-        user_oshi = user_oshi_result.scalars().first()
-        if not user_oshi:
-            return []
-
-        # 2) Schedule 조회 → 정렬
         oshi_schedules_query = (
             select(Schedule)
-            .where(Schedule.related_twitter_internal_id == user_oshi.oshi_internal_id)
+            .join(UserOshi, UserOshi.oshi_internal_id == Schedule.related_twitter_internal_id)
+            .where(UserOshi.user_id == user_id)
             .order_by(Schedule.start_at)
+            .execution_options(yield_per=SCHEDULE_STREAM_BATCH_SIZE)
         )
-        schedules_result = await self.db.execute(oshi_schedules_query)
-        return schedules_result.scalars().all()
\ No newline at end of file
+        schedules_result = await self.db.stream_scalars(oshi_schedules_query)
+        async for sched in schedules_result:
+            yield sched
\ No newline at end of file
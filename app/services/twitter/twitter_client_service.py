@@ -1,12 +1,88 @@
-import json
+import asyncio
 import logging
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import Dict, Optional, Set
+
+import httpx
+import orjson
 from twikit import Client
 
 from app.core.config import settings
+from app.utils.rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
-MASTER_COOKIE_FILE = Path(__file__).resolve().parent.parent.parent / "config" / "twitter_cookies_master.json"
+# 쿠키 파일 디렉토리 (settings에서 한 번 계산한 경로 재사용)
+_CONFIG_DIR = settings.CONFIG_DIR
+MASTER_COOKIE_FILE = _CONFIG_DIR / "twitter_cookies_master.json"
+# per-user 쿠키 파일 경로 형식
+_USER_COOKIE_PATH_FORMAT = str(_CONFIG_DIR / "twitter_cookies_{}.json")
+# 타임라인 요청 속도 제한 기준 시간 (트위터 rate limit 창: 15분)
+TIMELINE_RATE_PERIOD = 900.0
+# 프로세스 내에서 재사용할 사용자별 로그인 클라이언트 최대 개수 (LRU)
+CLIENT_CACHE_SIZE = 256
+# twikit 내부 httpx 클라이언트 커넥션 풀 / 타임아웃 (settings.TWITTER_HTTP2일 때만 적용)
+TWITTER_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60,
+)
+TWITTER_HTTP_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+# http.cookiejar.Cookie → (name, value) 튜플 (쿠키마다 속성 조회를 두 번 하지 않도록 C 레벨 getter 사용)
+_COOKIE_NAME_VALUE = attrgetter("name", "value")
+# 이미 생성(확인)한 쿠키 디렉토리
+_created_dirs: Set[Path] = set()
+# 캐시에서 제거된 인스턴스의 httpx 커넥션 풀 종료 태스크 (완료 전 GC되지 않도록 참조 유지)
+_closing_tasks: Set["asyncio.Task[None]"] = set()
+
+
+@lru_cache(maxsize=4)
+def _load_master_cookies(path: str, mtime_ns: int) -> Dict[str, str]:
+    """
+    마스터 쿠키 파일을 읽어 파싱한 dict를 반환
+    - 모든 사용자가 같은 파일을 공유하므로 (경로, 수정 시각)별로 한 번만 읽고 파싱
+    - 파일이 갱신되면 mtime_ns가 바뀌어 자동으로 다시 로드
+    """
+    return orjson.loads(Path(path).read_bytes())
+
+
+def _read_master_cookies() -> Dict[str, str]:
+    """
+    마스터 쿠키 파일의 수정 시각을 확인하고 캐시된(또는 새로 파싱한) dict 반환
+    - 파일 stat/read가 이벤트 루프를 막지 않도록 asyncio.to_thread로 호출
+    """
+    try:
+        mtime_ns = MASTER_COOKIE_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Master cookie file not found: {MASTER_COOKIE_FILE}")
+    return _load_master_cookies(str(MASTER_COOKIE_FILE), mtime_ns)
+
+
+def _read_cookie_file(path: Path) -> Optional[Dict[str, str]]:
+    """
+    per-user 쿠키 파일을 읽어 파싱 (파일이 없으면 None)
+    """
+    try:
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def _write_cookie_file(path: Path, cookies: Dict[str, str]) -> None:
+    """
+    쿠키 dict를 JSON 파일로 저장
+    - 임시 파일에 쓴 뒤 os.replace로 교체 (쓰기 도중 중단돼도 기존 파일이 깨지지 않음)
+    - 상위 디렉토리 생성(mkdir)은 디렉토리별로 최초 1회만 수행
+    """
+    if path.parent not in _created_dirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path.parent)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(orjson.dumps(cookies))
+    os.replace(tmp, path)
 
 class TwitterClientService:
     """
@@ -16,47 +92,151 @@ class TwitterClientService:
     - set_initial_cookies() 로 per-request ct0/auth_token 덮어쓰기
     - ensure_login() 시, 마스터+per-user 쿠키를 클라이언트에 적용
     - save_cookies_to_file() 로 per-user 쿠키 파일 생성
+    - get_or_create() 로 사용자별 로그인된 인스턴스를 요청 간에 재사용
+      (캐시에서 제거된 인스턴스와 앱 종료 시 남은 인스턴스의 커넥션 풀은 close)
     """
+    # user_internal_id → 로그인된 인스턴스 (쿠키 로드 + twikit Client의 커넥션 풀 재사용)
+    _cache: "OrderedDict[str, TwitterClientService]" = OrderedDict()
+
     def __init__(self, user_internal_id: str):
         self.user_id = user_internal_id
         locale = getattr(settings, "TWITTER_LOCALE", "en-US")
-        self._client = Client(locale)
-        self._logged_in = False
+        # twikit Client는 추가 kwargs를 내부 httpx.AsyncClient에 그대로 전달
+        # → HTTP/2 멀티플렉싱 + 넉넉한 keep-alive 풀로 TLS 핸드셰이크 재사용
+        if settings.TWITTER_HTTP2:
+            self._client = Client(
+                locale,
+                http2=True,
+                limits=TWITTER_HTTP_LIMITS,
+                timeout=TWITTER_HTTP_TIMEOUT,
+            )
+        else:
+            self._client = Client(locale)
+        # 공유 인스턴스에서 동시에 ensure_login이 호출돼도 쿠키는 한 번만 로드
+        # (첫 호출만 락을 잡고 로드, 완료 후에는 Event 확인만으로 즉시 반환)
+        self._login_lock = asyncio.Lock()
+        self._login_done = asyncio.Event()
+        # 트위터 rate limit은 세션(계정)별이므로 인스턴스마다 별도 버킷
+        self.timeline_limiter = AsyncRateLimiter(settings.TWITTER_TIMELINE_RATE_LIMIT, TIMELINE_RATE_PERIOD)
 
         # per-user 쿠키 저장 경로
-        self.cookie_path = MASTER_COOKIE_FILE.parent / f"twitter_cookies_{self.user_id}.json"
+        self.cookie_path = Path(_USER_COOKIE_PATH_FORMAT.format(self.user_id))
+
+    @classmethod
+    def get_or_create(cls, user_internal_id: str) -> "TwitterClientService":
+        """
+        사용자별 공유 인스턴스 반환 (없으면 생성하여 캐시)
+        - 최근 사용한 순으로 CLIENT_CACHE_SIZE개까지 유지
+        - 로그인은 기존과 같이 ensure_login()에서 최초 1회만 수행
+        """
+        instance = cls._cache.get(user_internal_id)
+        if instance is None:
+            instance = cls._cache[user_internal_id] = cls(user_internal_id)
+            while len(cls._cache) > CLIENT_CACHE_SIZE:
+                _, evicted = cls._cache.popitem(last=False)
+                evicted._schedule_close()
+        else:
+            cls._cache.move_to_end(user_internal_id)
+        return instance
+
+    @classmethod
+    def invalidate(cls, user_internal_id: str) -> None:
+        """
+        사용자의 공유 인스턴스를 캐시에서 제거 (쿠키 갱신 또는 인증 실패 시)
+        - 제거한 인스턴스의 httpx 커넥션 풀은 백그라운드에서 종료
+        """
+        instance = cls._cache.pop(user_internal_id, None)
+        if instance is not None:
+            instance._schedule_close()
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """
+        캐시된 모든 인스턴스의 httpx 커넥션 풀을 종료 (앱 종료 시 호출)
+        """
+        instances = list(cls._cache.values())
+        cls._cache.clear()
+        await asyncio.gather(*(instance.aclose() for instance in instances))
+        if _closing_tasks:
+            await asyncio.gather(*_closing_tasks)
+
+    async def aclose(self) -> None:
+        """
+        twikit Client 내부 httpx.AsyncClient(커넥션 풀) 종료
+        """
+        try:
+            await self._client.http.aclose()
+        except Exception as e:
+            logger.warning("Twitter HTTP 클라이언트 종료 실패 (%s): %s", self.user_id, e)
+
+    def _schedule_close(self) -> None:
+        """
+        캐시에서 제거된 인스턴스의 aclose()를 이벤트 루프에 예약
+        (get_or_create/invalidate는 동기 메서드이므로 완료를 기다리지 않음)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.aclose())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+
+    def is_logged_in(self) -> bool:
+        """
+        쿠키 로드가 이미 끝났는지 확인 (동기 메서드 → 호출 시 코루틴 생성 없음)
+        - 핫 경로에서는 False일 때만 ensure_login()을 await
+        """
+        return self._login_done.is_set()
 
     async def ensure_login(self) -> None:
         """
         (1) 마스터 쿠키 로드
         (2) per-user 쿠키가 있으면 덮어쓰기
+        - 쿠키 로드에 실패하면 공유 캐시에서 제거하여 다음 요청에서 새로 생성
         """
-        if not self._logged_in:
-            await self._load_cookies()
-            self._logged_in = True
+        if self._login_done.is_set():
+            return
+        async with self._login_lock:
+            if self._login_done.is_set():
+                return
+            try:
+                await self._load_cookies()
+            except Exception:
+                if self._cache.get(self.user_id) is self:
+                    self.invalidate(self.user_id)
+                raise
+            self._login_done.set()
 
     async def _load_cookies(self) -> None:
         """
         1) 마스터 쿠키 로드 (파일이 없으면 에러)
         2) per-user 쿠키가 있으면 덮어쓰기
+        3) 병합한 쿠키를 set_cookies 한 번으로 클라이언트에 적용
+        - 파일 I/O는 모두 워커 스레드에서 수행하여 동시 로그인 시 이벤트 루프가 멈추지 않도록 함
         """
-        if not MASTER_COOKIE_FILE.exists():
-            raise FileNotFoundError(f"Master cookie file not found: {MASTER_COOKIE_FILE}")
+        # 1) 마스터 쿠키
         try:
-            master_cookies = json.loads(MASTER_COOKIE_FILE.read_text(encoding="utf-8"))
-            self._client.set_cookies(master_cookies)
-            logger.info("Master cookies loaded")
+            master_cookies = await asyncio.to_thread(_read_master_cookies)
+        except FileNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Master 쿠키 로드 실패: {e}")
             raise
 
-        if self.cookie_path.exists():
-            try:
-                user_cookies = json.loads(self.cookie_path.read_text(encoding="utf-8"))
-                self._client.set_cookies(user_cookies)
-                logger.info("User cookies loaded: %s", self.cookie_path)
-            except Exception as e:
-                logger.error(f"Per-user 쿠키 로드 실패: {e}")
+        # 2) per-user 쿠키 (실패해도 마스터 쿠키만으로 진행)
+        user_cookies = None
+        try:
+            user_cookies = await asyncio.to_thread(_read_cookie_file, self.cookie_path)
+        except Exception as e:
+            logger.error(f"Per-user 쿠키 로드 실패: {e}")
+
+        # 3) 병합 (per-user 값 우선) → 캐시된 마스터 dict는 클라이언트와 공유하지 않음
+        merged = {**master_cookies, **user_cookies} if user_cookies else dict(master_cookies)
+        self._client.set_cookies(merged)
+        logger.info("Master cookies loaded")
+        if user_cookies:
+            logger.info("User cookies loaded: %s", self.cookie_path)
 
     def set_initial_cookies(self, ct0: str, auth_token: str) -> None:
         """
@@ -73,14 +253,16 @@ class TwitterClientService:
         """
         return self._client
 
-    def save_cookies_to_file(self) -> None:
+    async def save_cookies_to_file(self) -> None:
         """
-        현재 세션 쿠키를 per-user 파일로 저장
+        현재 세션 쿠키를 per-user 파일로 저장 (파일 쓰기는 워커 스레드에서 수행)
         """
         try:
-            cookies = {cookie.name: cookie.value for cookie in self._client.http.cookies.jar}
-            self.cookie_path.parent.mkdir(parents=True, exist_ok=True)
-            self.cookie_path.write_text(json.dumps(cookies), encoding="utf-8")
+            cookies = dict(map(_COOKIE_NAME_VALUE, self._client.http.cookies.jar))
+            await asyncio.to_thread(_write_cookie_file, self.cookie_path, cookies)
+            # 이전 쿠키로 로그인된 다른 공유 인스턴스는 새 쿠키로 다시 로드되도록 제거
+            if self._cache.get(self.user_id) is not self:
+                self.invalidate(self.user_id)
             logger.info("Saved Twitter cookies JSON: %s", self.cookie_path)
         except Exception as e:
             logger.error(f"쿠키 저장 중 오류: {e}")
\ No newline at end of file
@@ -1,51 +1,104 @@
 # app/services/twitter/twitter_service.py
 
 import re
-import json
+import base64
+import binascii
 import logging
-from datetime import datetime, timedelta
-from typing import Union, Optional, List, Tuple
+import struct
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Union, Optional, List, Tuple, Dict
 
 import asyncio
-from sqlalchemy.exc import IntegrityError
+import orjson
 from twikit.errors import NotFound as TwikitNotFound
 
-from app.models.post import Post
 from app.models.reply_log import ReplyLog
 from app.repositories.tweet_repository import TweetRepository
 from app.services.twitter.twitter_client_service import TwitterClientService
 from app.services.twitter.twitter_user_service import TwitterUserService
+from app.core.config import settings
 from app.services.llm.llm_service import LLMService
 from app.schemas.llm_schema import TranslationResult
 from app.utils.tco_resolver import TcoResolver
-from app.utils.exceptions import NotFoundError
+from app.utils.exceptions import BadRequestError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# 이미지 URL 해석(Selenium 브라우저 기동)을 동시에 실행할 최대 트윗 수
+IMAGE_RESOLVE_CONCURRENCY = 4
 
-def _parse_any_datetime(dt: Union[str, datetime, None]) -> Optional[datetime]:
+# “YYYY.MM.DD HH:MM:SS ␞ YYYY.MM.DD HH:MM:SS” 또는 “None ␞ None” 스케줄 라인 패턴
+_SCHEDULE_LINE_RE = re.compile(
+    r'^(?:\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}|None) ␞ (?:\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}|None)$'
+)
+# 리플 본문 앞의 “@screen_name ” 멘션 접두사
+_LEADING_MENTION_RE = re.compile(r'^@\w+\s*')
+
+
+# Twitter created_at 월 약어 → 월 번호
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+# Twitter created_at(UTC) → KST 변환 오프셋
+KST_OFFSET = timedelta(hours=9)
+
+# DB cursor: (tweet_date를 기준 시각부터의 마이크로초, tweet_id) → little-endian int64 2개 (16바이트)
+_DB_CURSOR_STRUCT = struct.Struct("<qq")
+# naive DB datetime을 타임존 해석 없이 정수로 바꾸기 위한 기준 시각
+_DB_CURSOR_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_str(s: str) -> Optional[datetime]:
     """
-    문자열 또는 datetime을 받아 datetime 객체로 변환
-    - Twikit에서 리턴된 str: "%a %b %d %H:%M:%S %z %Y" 또는 "%Y.%m.%d %H:%M:%S" 포맷을 지원
+    _parse_any_datetime의 문자열 분기 (같은 문자열은 캐시된 결과 재사용)
+    - 고정 폭 포맷은 strptime(포맷 문자열 해석 + locale 조회) 대신 슬라이스로 직접 파싱
+    - 형태가 다르면 기존 strptime 경로로 처리
     """
-    if not dt:
-        return None
-    if isinstance(dt, datetime):
-        return dt
-    s = dt.strip()
     try:
         # 예: "Wed Jun 18 12:34:56 +0000 2025"
+        if len(s) == 30 and s[20:25] == "+0000":
+            utc = datetime(
+                int(s[26:30]), _MONTHS[s[4:7]], int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                tzinfo=timezone.utc,
+            )
+            return utc + KST_OFFSET  # KST 기준으로 변환
+        # 예: "2025.06.18 21:34:56"
+        if len(s) == 19 and s[4] == "." and s[7] == ".":
+            return datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19]),
+            )
+    except (KeyError, ValueError):
+        pass
+
+    try:
         utc = datetime.strptime(s, "%a %b %d %H:%M:%S %z %Y")
-        return utc + timedelta(hours=9)  # KST 기준으로 변환
+        return utc + KST_OFFSET
     except Exception:
         pass
     try:
-        # 예: "2025.06.18 21:34:56"
         return datetime.strptime(s, "%Y.%m.%d %H:%M:%S")
     except Exception:
         return None
 
 
+def _parse_any_datetime(dt: Union[str, datetime, None]) -> Optional[datetime]:
+    """
+    문자열 또는 datetime을 받아 datetime 객체로 변환
+    - Twikit에서 리턴된 str: "%a %b %d %H:%M:%S %z %Y" 또는 "%Y.%m.%d %H:%M:%S" 포맷을 지원
+    """
+    if not dt:
+        return None
+    if isinstance(dt, datetime):
+        return dt
+    return _parse_datetime_str(dt.strip())
+
+
 def _format_dt(dt: Union[str, datetime]) -> str:
     """
     datetime 또는 문자열(dt)이 들어오면 “YYYY-MM-DD HH:MM:SS” 형태로 반환
@@ -55,6 +108,54 @@ def _format_dt(dt: Union[str, datetime]) -> str:
     return dt
 
 
+def _format_db_dt(dt: Optional[datetime]) -> Optional[str]:
+    """
+    DB에서 읽은 naive datetime을 “YYYY-MM-DD HH:MM:SS” 형태로 반환 (None이면 None)
+    - strftime 포맷 문자열 해석 없이 C 구현 isoformat으로 직렬화
+    """
+    return dt.isoformat(sep=" ", timespec="seconds") if dt else None
+
+
+def _serialize_post(post, author, profile_image_url: Optional[str]) -> dict:
+    """
+    저장된 Post 한 건을 list_saved_tweets 응답 형식의 dict로 변환
+    - author: Post의 작성자(TwitterUser), 없으면 None
+    """
+    return {
+        "tweet_userid": author.twitter_id if author else None,
+        "tweet_id": post.tweet_id,
+        "tweet_username": author.username if author else None,
+        "tweet_date": _format_db_dt(post.tweet_date),
+        "tweet_text": post.tweet_text,
+        "tweet_translated_text": post.tweet_translated_text,
+        "tweet_about": post.tweet_about,
+        "tweet_included_start_date": _format_db_dt(post.tweet_included_start_date),
+        "tweet_included_end_date": _format_db_dt(post.tweet_included_end_date),
+        "image_urls": orjson.loads(post.image_urls) if post.image_urls else [],
+        "profile_image_url": profile_image_url,
+    }
+
+
+def _encode_db_cursor(tweet_date: datetime, tweet_id: int) -> str:
+    """
+    keyset pagination 위치를 16바이트로 pack 후 base64-url-safe 문자열로 변환
+    """
+    us = (tweet_date - _DB_CURSOR_EPOCH) // _ONE_MICROSECOND
+    return base64.urlsafe_b64encode(_DB_CURSOR_STRUCT.pack(us, tweet_id)).decode()
+
+
+def _decode_db_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    _encode_db_cursor로 만든 cursor를 (tweet_date, tweet_id)로 복원
+    - 형식이 맞지 않으면 BadRequestError
+    """
+    try:
+        us, tweet_id = _DB_CURSOR_STRUCT.unpack(base64.urlsafe_b64decode(cursor))
+        return _DB_CURSOR_EPOCH + timedelta(microseconds=us), tweet_id
+    except (binascii.Error, struct.error, ValueError, OverflowError):
+        raise BadRequestError("Invalid db_cursor")
+
+
 class TwitterService:
     """
     트위터-LLM 연동 서비스
@@ -63,16 +164,27 @@ class TwitterService:
     - 분류·스케줄 체크 (classify_and_schedule)
     """
 
-    def __init__(self, db, llm_service: LLMService, user_internal_id: str):
+    def __init__(
+        self,
+        db,
+        llm_service: LLMService,
+        user_internal_id: str,
+        llm_concurrency: Optional[int] = None,
+        image_concurrency: int = IMAGE_RESOLVE_CONCURRENCY,
+    ):
         """
         Args:
             db: AsyncSession
             llm_service: LLMService 인스턴스
             user_internal_id: 로그인된 유저의 Twitter 내부 ID (문자열)
+            llm_concurrency: 일괄 번역 시 동시 LLM 요청 수 (기본: settings.LLM_CONCURRENCY)
+            image_concurrency: 동시에 해석할 이미지 URL 수 (Selenium 브라우저 기동 수)
         """
+        self.llm_concurrency = llm_concurrency or settings.LLM_CONCURRENCY
+        self.image_concurrency = image_concurrency
         self.repo = TweetRepository(db)
         self.llm = llm_service
-        self.twitter_client = TwitterClientService(user_internal_id)
+        self.twitter_client = TwitterClientService.get_or_create(user_internal_id)
         self.twitter_user = TwitterUserService(self.twitter_client)
         self.resolver = TcoResolver()
 
@@ -86,8 +198,8 @@ class TwitterService:
         """
         1) 로그인 보장 → screen_name → internal_id (Twikit)
         2) Twikit으로부터 최신 트윗 스크랩
-        3) DB에 저장되지 않은 신규 트윗만 가공 → Post 리스트 생성
-        4) Post 리스트를 DB에 일괄 저장 (commit/rollback 포함)
+        3) DB에 저장되지 않은 신규 트윗만 가공 → Post 행(dict) 리스트 생성
+        4) multi-row INSERT 한 번으로 DB에 일괄 저장 (PK 중복은 건너뜀, commit/rollback 포함)
         5) 다음 remote cursor 반환
         """
         # 1) 로그인 및 사용자 내부 ID 확인
@@ -102,11 +214,15 @@ class TwitterService:
             # 신규 트윗이 없으면, 그냥 이전 cursor 그대로 반환
             return next_remote
 
-        # 3) DB에 저장되지 않은 신규 트윗만 필터링 → Post 객체 생성
-        existing_ids = await self.repo.list_tweet_ids()
-        new_posts = await self._prepare_posts_for_save(
-            tweets, existing_ids, author_id
-        )
+        # 3) DB에 저장되지 않은 신규 트윗만 필터링 → Post 행(dict) 생성
+        #    (이미 저장된 트윗은 번역/이미지 해석 비용을 쓰지 않도록 미리 제외)
+        #    (전체 트윗 ID가 아니라 이번 배치의 ID만 PK로 조회)
+        #    (str → int 변환은 트윗마다 한 번만 수행하고 (tweet_id, tweet) 쌍으로 전달)
+        tweet_list = list(tweets)
+        ids = [int(t.id) for t in tweet_list]
+        existing_ids = frozenset(await self.repo.existing_tweet_ids(ids))
+        new_items = [(tid, t) for tid, t in zip(ids, tweet_list) if tid not in existing_ids]
+        new_posts = await self._prepare_posts_for_save(new_items, author_id)
 
         # 4) DB 저장
         if new_posts:
@@ -120,7 +236,8 @@ class TwitterService:
         Twikit Client로 로그인 보장 후,
         screen_name → internal_id(문자열) 반환
         """
-        await self.twitter_client.ensure_login()
+        if not self.twitter_client.is_logged_in():
+            await self.twitter_client.ensure_login()
         try:
             user_info = await self.twitter_user.get_user_info(screen_name)
         except NotFoundError as e:
@@ -139,15 +256,17 @@ class TwitterService:
     ) -> Tuple[List, Optional[str]]:
         """
         Twikit Client를 사용하여 트윗 목록과 다음 cursor 획득
+        - 세션별 타임라인 요청 속도 제한을 넘지 않도록 대기 후 호출 (429 방지)
         """
         client = self.twitter_client.get_client()
         try:
-            tweets = await client.get_user_tweets(
-                user_id=author_id,
-                tweet_type="Tweets",
-                count=batch_size,
-                cursor=remote_cursor,
-            )
+            async with self.twitter_client.timeline_limiter:
+                tweets = await client.get_user_tweets(
+                    user_id=author_id,
+                    tweet_type="Tweets",
+                    count=batch_size,
+                    cursor=remote_cursor,
+                )
         except Exception as e:
             logger.error(f"트윗 스크랩 실패 (author_id={author_id}): {e}")
             raise
@@ -159,104 +278,134 @@ class TwitterService:
     # ────────────────────────────────────────────────────────────────────────────
     async def _prepare_posts_for_save(
         self,
-        tweets,             # Twikit Tweet 객체 리스트
-        existing_ids: set,
+        new_items: List[Tuple[int, Any]],   # DB에 없는 (tweet_id, Twikit Tweet) 목록
         author_id: str
-    ) -> List[Post]:
+    ) -> List[Dict[str, Any]]:
         """
-        DB에 저장되지 않은 신규 트윗만 골라서,
-        1) LLM 번역
-        2) 이미지 URL 추출
-        3) Post 모델 인스턴스 생성
+        DB에 저장되지 않은 신규 트윗에 대해,
+        1) LLM 번역과 이미지 URL 추출을 동시에 실행 (트윗별 네트워크 대기를 직렬로 쌓지 않음)
+        2) 일괄 INSERT용 Post 행(dict) 생성
         """
-        new_posts: List[Post] = []
-
-        for t in tweets:
-            tid = int(t.id)
-            if tid in existing_ids:
-                continue
+        new_posts: List[Dict[str, Any]] = []
+        if not new_items:
+            return new_posts
+        new_tweets = [t for _, t in new_items]
+
+        # (1) LLM 번역(RAG 컨텍스트 배치 조회 + 묶음 번역 동시 실행)과
+        #     배치 전체의 이미지 URL 해석(중복 제거 후 1회씩)을 함께 대기
+        photo_urls = [self._photo_urls(t.media) for t in new_tweets]
+        translations, resolved_map = await asyncio.gather(
+            self._translate_tweets(new_tweets),
+            self._resolve_image_urls([url for urls in photo_urls for url in urls]),
+        )
 
+        for (tid, t), tr, urls in zip(new_items, translations, photo_urls):
+            imgs = [resolved_map.get(url, url) for url in urls]
             text = t.full_text
-            date_str = _format_dt(t.created_at)
-
-            # (1) LLM 번역
-            try:
-                tr: TranslationResult = await self.llm.translate(text, date_str)
-                logger.info(
-                    f"LLM 번역 결과 ▶ tweet_id={tid} "
-                    f"translated={tr.translated} category={tr.category} start={tr.start} end={tr.end}"
-                )
-            except Exception:
-                logger.exception("LLM 번역 실패, 원문으로 저장 tweet_id=%s", tid)
-                tr = TranslationResult(
-                    translated=text, category="일반", start=None, end=None
-                )
-
-            # (2) 이미지 URL 추출
-            imgs = await self._extract_image_urls(t.media)
-
-            # (3) Post 모델 객체 생성
-            tweet_date = _parse_any_datetime(t.created_at)
-            post = Post(
-                tweet_id=tid,
-                author_internal_id=author_id,
-                tweet_date=tweet_date,
-                tweet_included_start_date=_parse_any_datetime(tr.start),
-                tweet_included_end_date=_parse_any_datetime(tr.end),
-                tweet_text=text,
-                tweet_translated_text=tr.translated,
-                tweet_about=tr.category,
-                image_urls=json.dumps(imgs),
+            logger.info(
+                f"LLM 번역 결과 ▶ tweet_id={tid} "
+                f"translated={tr.translated} category={tr.category} start={tr.start} end={tr.end}"
             )
-            new_posts.append(post)
+
+            # (2) 일괄 INSERT용 Post 행(dict) 생성
+            new_posts.append({
+                "tweet_id": tid,
+                "author_internal_id": author_id,
+                "tweet_date": _parse_any_datetime(t.created_at),
+                "tweet_included_start_date": _parse_any_datetime(tr.start),
+                "tweet_included_end_date": _parse_any_datetime(tr.end),
+                "tweet_text": text,
+                "tweet_translated_text": tr.translated,
+                "tweet_about": tr.category,
+                "image_urls": orjson.dumps(imgs).decode(),
+            })
 
         return new_posts
 
     # ────────────────────────────────────────────────────────────────────────────
-    async def _extract_image_urls(self, media_entries: list) -> List[str]:
+    async def _translate_tweets(self, tweets) -> List[TranslationResult]:
         """
-        이미지(media) URL을 비동기적으로 실제 큰 이미지 URL로 변환
-        (t.co 단축 URL 및 twitter.com/photo 링크를 TcoResolver로 해석)
+        트윗 목록을 한 번에 번역 (동시 LLM 요청 수는 self.llm_concurrency로 제한)
+        - 개별 실패는 translate_many 내부에서 원문으로 대체
+        - 일괄 처리 자체가 실패하면 모든 트윗을 원문으로 저장
+        """
+        try:
+            return await self.llm.translate_many(
+                [(t.full_text, _format_dt(t.created_at)) for t in tweets],
+                concurrency=self.llm_concurrency,
+                pack_size=settings.LLM_BATCH_MAX_ITEMS,
+                pack_chars=settings.LLM_BATCH_MAX_CHARS,
+            )
+        except Exception:
+            logger.exception("LLM 일괄 번역 실패, 원문으로 저장")
+            return [
+                TranslationResult(translated=t.full_text, category="일반", start=None, end=None)
+                for t in tweets
+            ]
+
+    # ────────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _photo_urls(media_entries: list) -> List[str]:
+        """
+        트윗 media 중 사진(type="photo")의 원본 URL 목록 반환
+        - `media_url_https` 속성이 있으면 그걸, 아니면 `url` 속성 사용
+        - twikit 버전에 따라 media가 dict로 오는 경우도 같은 키로 처리
         """
         raw_urls = []
-        for m in media_entries or []:
-            # 트윗 media에 type="photo"인 항목만 필터
-            if getattr(m, "type", None) != "photo":
-                continue
-            # `media_url_https` 속성이 있으면 그걸, 아니면 `url` 속성 사용
-            url = getattr(m, "media_url_https", None) or getattr(m, "url", None)
+        for m in media_entries or ():
+            if isinstance(m, dict):
+                if m.get("type") != "photo":
+                    continue
+                url = m.get("media_url_https") or m.get("url")
+            else:
+                if getattr(m, "type", None) != "photo":
+                    continue
+                url = getattr(m, "media_url_https", None) or getattr(m, "url", None)
             if url:
                 raw_urls.append(url)
+        return raw_urls
 
-        resolved = []
-        for url in raw_urls:
-            # t.co로 단축되었거나, twitter.com/photo 링크면 실제 URL으로 해석
-            if "t.co/" in url or "twitter.com/photo" in url:
-                try:
-                    imgs = await self.resolver.resolve([url])
-                    resolved.append(imgs[0] if imgs else url)
-                except Exception:
-                    logger.warning("이미지 추출 실패, 원본 URL 사용: %s", url)
-                    resolved.append(url)
-            else:
-                resolved.append(url)
+    # ────────────────────────────────────────────────────────────────────────────
+    async def _resolve_image_urls(self, urls: List[str]) -> Dict[str, str]:
+        """
+        t.co 단축 URL 및 twitter.com/photo 링크를 TcoResolver로 실제 큰 이미지 URL로 해석
+        - 배치 전체에서 중복을 제거하여 URL마다 한 번만 해석
+        - URL을 최대 self.image_concurrency개 묶음으로 나눠 묶음마다 브라우저 하나를 재사용
+          (브라우저 기동 횟수 = 동시 실행 수, URL 수와 무관)
+        - 해석에 실패한 URL은 원본 URL로 대체 (결과에서 빠진 URL은 호출 측에서 원본 사용)
+        Returns:
+            {원본 URL: 해석된 URL} (해석이 필요 없는 URL은 포함하지 않음)
+        """
+        targets = [
+            url for url in dict.fromkeys(urls)
+            if "t.co/" in url or "twitter.com/photo" in url
+        ]
+        if not targets:
+            return {}
+        chunks = [targets[i::self.image_concurrency] for i in range(self.image_concurrency)]
+        chunks = [chunk for chunk in chunks if chunk]
+
+        results = await asyncio.gather(
+            *(self.resolver.resolve_many(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+        resolved: Dict[str, str] = {}
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.warning("이미지 추출 실패, 원본 URL 사용: %s (%s)", chunk, result)
+                continue
+            resolved.update(result)
         return resolved
 
     # ────────────────────────────────────────────────────────────────────────────
-    async def _save_posts_batch(self, posts: List[Post]) -> None:
+    async def _save_posts_batch(self, posts: List[Dict[str, Any]]) -> None:
         """
-        여러 Post 인스턴스를 DB에 일괄 저장
-        commit/rollback 처리 모두 이 메소드에서 처리
+        여러 Post 행을 multi-row INSERT 한 번으로 DB에 일괄 저장
+        - 이미 저장된 tweet_id는 ON DUPLICATE KEY로 건너뛰므로 중복 충돌로 배치 전체가 실패하지 않음
+        - 그 밖의 DB 오류는 repository에서 롤백 후 그대로 전파 (저장 실패를 성공으로 보고하지 않음)
         """
-        try:
-            for post in posts:
-                self.repo.add_post(post)
-            await self.repo.commit()
-            logger.info(f"새 트윗 {len(posts)}건 DB 저장 성공")
-        except IntegrityError as e:
-            await self.repo.rollback()
-            logger.warning("DB 저장 중 IntegrityError 발생, 롤백: %s", e)
-            # IntegrityError 시 중복 충돌 등으로 새로 저장 실패 → 무시하고 넘어갑니다.
+        await self.repo.bulk_insert_posts(posts)
+        logger.info(f"새 트윗 {len(posts)}건 DB 저장 성공")
 
     # ────────────────────────────────────────────────────────────────────────────
     async def list_saved_tweets(
@@ -269,7 +418,7 @@ class TwitterService:
         DB에 저장된 트윗을 Keyset Pagination 방식으로 반환
         - screen_name: 트위터 스크린네임
         - count: 가져올 최대 개수
-        - db_cursor: “ISO_DATETIME|TWEET_ID” base64-url-safe 형식의 cursor
+        - db_cursor: (tweet_date, tweet_id)를 pack한 base64-url-safe 형식의 cursor
         Returns:
             (serialized_posts, next_db_cursor)
         """
@@ -285,49 +434,24 @@ class TwitterService:
         # 2) db_cursor 파싱
         last_date = last_id = None
         if db_cursor:
-            import base64
-            raw = base64.urlsafe_b64decode(db_cursor.encode()).decode()
-            dt_str, id_str = raw.split("|", 1)
-            last_date = datetime.fromisoformat(dt_str)
-            last_id = int(id_str)
-
-        # 3) TweetRepository를 통해 Post 리스트 조회
-        posts = await self.repo.list_posts_by_cursor(
+            last_date, last_id = _decode_db_cursor(db_cursor)
+
+        # 3) TweetRepository를 통해 Post를 스트리밍 조회하며
+        # 4) 스키마에 맞게 바로 직렬화 (ORM 객체 리스트를 따로 만들지 않음)
+        #    (작성자는 조회 쿼리의 조인 결과로 이미 채워져 있어 추가 SELECT 없음)
+        serialized: List[dict] = []
+        last = None
+        async for last in self.repo.stream_posts_by_cursor(
             twitter_id=screen_name,
             limit=count,
             last_date=last_date,
             last_id=last_id
-        )
-
-        # 4) 스키마에 맞게 직렬화
-        serialized = []
-        for p in posts:
-            serialized.append({
-                "tweet_userid": p.author.twitter_id,
-                "tweet_id": p.tweet_id,
-                "tweet_username": p.author.username,
-                "tweet_date": p.tweet_date.strftime("%Y-%m-%d %H:%M:%S"),
-                "tweet_text": p.tweet_text,
-                "tweet_translated_text": p.tweet_translated_text,
-                "tweet_about": p.tweet_about,
-                "tweet_included_start_date": (
-                    p.tweet_included_start_date.strftime("%Y-%m-%d %H:%M:%S")
-                    if p.tweet_included_start_date else None
-                ),
-                "tweet_included_end_date": (
-                    p.tweet_included_end_date.strftime("%Y-%m-%d %H:%M:%S")
-                    if p.tweet_included_end_date else None
-                ),
-                "image_urls": json.loads(p.image_urls) if p.image_urls else [],
-                "profile_image_url": profile_image_url,
-            })
+        ):
+            serialized.append(_serialize_post(last, last.author, profile_image_url))
 
-        # 5) 다음 cursor 생성
-        if posts:
-            last = posts[-1]
-            tok = f"{last.tweet_date.isoformat()}|{last.tweet_id}"
-            import base64
-            next_db = base64.urlsafe_b64encode(tok.encode()).decode()
+        # 5) 다음 cursor 생성 (마지막으로 받은 Post 기준)
+        if last is not None:
+            next_db = _encode_db_cursor(last.tweet_date, last.tweet_id)
         else:
             next_db = None
 
@@ -352,33 +476,29 @@ class TwitterService:
         if post.schedule_checked:
             return (
                 post.tweet_about,
-                post.tweet_included_start_date.strftime("%Y-%m-%d %H:%M:%S")
-                if post.tweet_included_start_date else None,
-                post.tweet_included_end_date.strftime("%Y-%m-%d %H:%M:%S")
-                if post.tweet_included_end_date else None,
+                _format_db_dt(post.tweet_included_start_date),
+                _format_db_dt(post.tweet_included_end_date),
                 post.schedule_title,
                 post.schedule_description,
             )
 
-        # 3-1) 분류
+        # 3) 분류와 스케줄 원시 추출은 서로 독립적이므로 동시에 실행
+        #    (스케줄 체인은 동기 → LLM 속도 제한을 거쳐 워커 스레드에서 호출)
         base_text = post.tweet_text
-        category, class_title, class_desc = await self.llm.classify(base_text)
+        date_str = _format_db_dt(post.tweet_date)
+        pipeline = self.llm.pipeline
+        (category, class_title, class_desc), raw_output = await asyncio.gather(
+            self.llm.classify(base_text),
+            pipeline.run_chain(pipeline.sched_chain.run, base_text, date_str),
+        )
         logger.info(
             f"LLM 분류 결과 ▶ tweet_id={tweet_id}  category={category}  title={class_title}  desc={class_desc}"
         )
 
-        # 3-2) 스케줄 원시 추출 (스케줄 체인은 동기 → to_thread로 호출)
-        date_str = post.tweet_date.strftime("%Y-%m-%d %H:%M:%S")
-        raw_output = await asyncio.to_thread(
-            self.llm.pipeline.sched_chain.run, base_text, date_str
-        )
         # 첫 줄만 취함
         first_line = raw_output.strip().splitlines()[0]
         # “YYYY.MM.DD HH:MM:SS ␞ YYYY.MM.DD HH:MM:SS” 또는 “None ␞ None” 패턴 검사
-        if not re.match(
-            r'^(?:\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}|None) ␞ (?:\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}:\d{2}|None)$',
-            first_line
-        ):
+        if not _SCHEDULE_LINE_RE.match(first_line):
             first_line = "None ␞ None"
 
         start, end = [s.strip() for s in first_line.split("␞", 1)]
@@ -414,7 +534,8 @@ class TwitterService:
         - cursor: 시작 인덱스
         - count: 가져올 개수
         """
-        await self.twitter_client.ensure_login()
+        if not self.twitter_client.is_logged_in():
+            await self.twitter_client.ensure_login()
         client = self.twitter_client.get_client()
 
         try:
@@ -433,7 +554,7 @@ class TwitterService:
 
         out: List[dict] = []
         for r in page:
-            text = re.sub(r'^@\w+\s*', '', r.full_text or '')
+            text = _LEADING_MENTION_RE.sub('', r.full_text or '')
             out.append({
                 "id": int(r.id),
                 "screen_name": r.user.screen_name,
@@ -452,7 +573,8 @@ class TwitterService:
         """
         주어진 tweet_id에 리플(댓글)을 전송하고, DB 로그 남긴 뒤 결과 반환
         """
-        await self.twitter_client.ensure_login()
+        if not self.twitter_client.is_logged_in():
+            await self.twitter_client.ensure_login()
         client = self.twitter_client.get_client()
 
         try:
@@ -502,7 +624,8 @@ class TwitterService:
         """
         주어진 reply_id(트윗 ID)에 해당하는 리플라이를 삭제하고 DB 로그에서도 삭제
         """
-        await self.twitter_client.ensure_login()
+        if not self.twitter_client.is_logged_in():
+            await self.twitter_client.ensure_login()
         client = self.twitter_client.get_client()
 
         try:
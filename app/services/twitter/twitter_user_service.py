@@ -1,4 +1,8 @@
 import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
 from twikit.errors import NotFound as TwikitNotFound
 
 from app.services.twitter.twitter_client_service import TwitterClientService
@@ -6,6 +10,42 @@ from app.utils.exceptions import NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# ─── screen_name → internal ID 캐시 ─────────────────────────────────────
+# screen_name과 내부 ID의 매핑은 수 시간 단위로 안정적이므로 TTL 동안 API 호출 없이 재사용
+# (서비스 인스턴스는 요청마다 생성되므로 모듈 전역으로 공유)
+USER_ID_CACHE_TTL = 3600.0
+USER_ID_CACHE_SIZE = 10_000
+_user_id_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+# ─── screen_name → 사용자 정보 캐시 ─────────────────────────────────────
+# 타임라인 페이지 요청마다 프로필 이미지 때문에 같은 사용자를 다시 조회하지 않도록 짧은 TTL로 재사용
+USER_INFO_CACHE_TTL = 300.0
+USER_INFO_CACHE_SIZE = 1024
+_user_info_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+
+
+def _ttl_cache_get(cache: "OrderedDict[str, Tuple[float, Any]]", key: str) -> Optional[Any]:
+    """
+    만료되지 않은 캐시 값을 반환 (없거나 만료되면 None)
+    """
+    cached = cache.get(key)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    cache.move_to_end(key)
+    return cached[1]
+
+
+def _ttl_cache_put(
+    cache: "OrderedDict[str, Tuple[float, Any]]", key: str, value: Any, ttl: float, max_size: int
+) -> None:
+    """
+    (만료 시각, 값)을 저장하고 최근 사용 순으로 max_size개까지만 유지
+    """
+    cache[key] = (time.monotonic() + ttl, value)
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
 class TwitterUserService:
     """
     트위터 유저 정보 조회 서비스 클래스
@@ -46,9 +86,16 @@ class TwitterUserService:
                 "followers_count": int,
                 "following_count": int,
             }
+        - 최근 USER_INFO_CACHE_TTL초 이내에 조회한 screen_name은 캐시에서 반환 (트위터 API 호출 생략)
         Raises:
             NotFoundError: 사용자 정보를 찾지 못한 경우
         """
+        # 0) 캐시 확인 (호출 측에서 수정해도 캐시가 바뀌지 않도록 복사본 반환)
+        key = screen_name.lower()
+        cached = _ttl_cache_get(_user_info_cache, key)
+        if cached is not None:
+            return dict(cached)
+
         # 1) 로그인된 TwitterClientService를 통해 client 인스턴스 획득
         await self.client_service.ensure_login()
         client = self.client_service.get_client()
@@ -79,8 +126,8 @@ class TwitterUserService:
             )
             raise NotFoundError(f"User '{screen_name}' not found")
 
-        # 4) 정상 조회된 경우 필요한 필드를 리턴
-        return {
+        # 4) 정상 조회된 경우 필요한 필드를 캐시에 저장 후 리턴
+        info = {
             "id": user.id,
             "username": self._fix_encoding(user.name),
             "bio": self._fix_encoding(user.description),
@@ -89,14 +136,25 @@ class TwitterUserService:
             "followers_count": user.followers_count,
             "following_count": user.following_count,
         }
+        _ttl_cache_put(_user_info_cache, key, info, USER_INFO_CACHE_TTL, USER_INFO_CACHE_SIZE)
+        return dict(info)
 
     async def get_user_id(self, screen_name: str) -> str:
         """
         screen_name을 통해 internal ID(str)만 반환
+        - 최근 USER_ID_CACHE_TTL초 이내에 조회한 screen_name은 캐시에서 반환 (트위터 API 호출 생략)
         """
+        # screen_name은 대소문자를 구분하지 않음
+        key = screen_name.lower()
+        cached = _ttl_cache_get(_user_id_cache, key)
+        if cached is not None:
+            return cached
+
         info = await self.get_user_info(screen_name)
         user_id = str(info["id"])
         logger.info("[TwitterUserService] %s → id: %s", screen_name, user_id)
+
+        _ttl_cache_put(_user_id_cache, key, user_id, USER_ID_CACHE_TTL, USER_ID_CACHE_SIZE)
         return user_id
 
     async def user_exists(self, screen_name: str) -> bool:
@@ -1,13 +1,100 @@
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 _embed_model: SentenceTransformer | None = None
 
+def select_device() -> str:
+    """
+    SentenceTransformer를 올릴 장치 선택 (CUDA → Apple MPS → CPU 순)
+    """
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
 def get_sentence_embedding_model() -> SentenceTransformer:
     """
     전역 싱글톤으로 SentenceTransformer 모델을 로드하여 반환
     - 최초 호출 시에만 모델을 로드하고 이후에는 캐시된 인스턴스 재사용
+    - GPU가 있으면 GPU에 로드
     """
     global _embed_model
     if _embed_model is None:
-        _embed_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-    return _embed_model
\ No newline at end of file
+        _embed_model = SentenceTransformer(
+            "sentence-transformers/all-MiniLM-L6-v2",
+            device=select_device(),
+        )
+    return _embed_model
+
+
+class OnnxSentenceEmbedder:
+    """
+    ONNX Runtime(INT8 양자화) 기반 MiniLM 임베더
+    - app/rag_data/export_onnx.py로 내보낸 모델 디렉토리를 로드
+    - SentenceTransformer.encode와 같은 시그니처를 제공하여 그대로 교체 가능
+    - mean pooling + (선택) L2 정규화를 NumPy로 수행
+    """
+    def __init__(
+        self,
+        model_dir: str,
+        model_file: str = "model_quantized.onnx",
+        num_threads: Optional[int] = None,
+    ):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        path = Path(model_dir)
+        self.tokenizer = AutoTokenizer.from_pretrained(str(path))
+
+        # 연산자 내부 병렬화 스레드 수 지정 + 그래프 최적화 전체 적용
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = num_threads or os.cpu_count() or 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(path / model_file),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        """
+        문장 목록을 (len(sentences), d) float32 임베딩 행렬로 변환
+        """
+        outputs: List[np.ndarray] = []
+        for start in range(0, len(sentences), batch_size):
+            batch = sentences[start:start + batch_size]
+            encoded = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                return_tensors="np",
+            )
+            feeds = {k: v.astype(np.int64) for k, v in encoded.items() if k in self._input_names}
+            token_embeddings = self.session.run(None, feeds)[0]
+
+            # attention mask 기반 mean pooling
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            pooled = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+            outputs.append(pooled.astype(np.float32))
+
+        embeddings = np.concatenate(outputs) if outputs else np.zeros((0, 0), dtype=np.float32)
+        if normalize_embeddings and embeddings.size:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+        return embeddings
@@ -0,0 +1,36 @@
+from typing import Optional
+
+import httpx
+
+# ─── 상수 정의 ─────────────────────────────────────────────────────
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_TIMEOUT = 30.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    전역 싱글톤으로 공유 httpx.AsyncClient를 반환
+    - 최초 호출 시에만 생성하고 이후에는 같은 커넥션 풀을 재사용 (요청마다 TCP/TLS 핸드셰이크 방지)
+    - 앱 종료 시 close_http_client()로 정리
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=DEFAULT_TIMEOUT,
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """
+    공유 httpx.AsyncClient의 커넥션 풀을 닫음
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -1,10 +1,14 @@
 import httpx
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from app.utils.http_client import get_http_client
 
 class OllamaClient:
-    def __init__(self, base_url: str, model: str):
+    def __init__(self, base_url: str, model: str, http_client: Optional[httpx.AsyncClient] = None):
         self.base_url = base_url.rstrip('/')
         self.model = model
+        # 주입된 클라이언트가 없으면 앱 전역 커넥션 풀을 공유
+        self._http_client = http_client
 
     async def chat(self, messages: List[Dict], temperature: float = 0.5) -> str:
         payload = {
@@ -12,8 +16,8 @@ class OllamaClient:
             "messages": messages,
             "temperature": temperature
         }
-        async with httpx.AsyncClient() as client:
-            r = await client.post(f"{self.base_url}/chat/completions", json=payload, timeout=60.0)
-            r.raise_for_status()
-            data = r.json()
-            return data["choices"][0]["message"]["content"].strip()
\ No newline at end of file
+        client = self._http_client or get_http_client()
+        r = await client.post(f"{self.base_url}/chat/completions", json=payload, timeout=60.0)
+        r.raise_for_status()
+        data = r.json()
+        return data["choices"][0]["message"]["content"].strip()
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    토큰 버킷 방식의 비동기 요청 속도 제한기
+    - period초 동안 최대 rate회까지 허용 (버스트도 rate회까지)
+    - 토큰이 없으면 다음 토큰이 채워질 때까지 대기 후 진행
+    - `async with limiter:` 형태로 외부 API 호출을 감싸서 사용
+    """
+    def __init__(self, rate: float, period: float = 60.0):
+        """
+        - rate: period초 동안 허용할 최대 요청 수
+        - period: 기준 시간(초)
+        """
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate와 period는 0보다 커야 합니다.")
+        self.capacity = float(rate)
+        self.refill_per_sec = rate / period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """
+        마지막 갱신 이후 경과 시간만큼 토큰 보충
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_sec)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """
+        토큰 1개를 소비 (없으면 채워질 때까지 대기)
+        - 대기 중인 호출은 락 순서대로 처리되어 먼저 온 요청이 먼저 진행
+        """
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.refill_per_sec)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
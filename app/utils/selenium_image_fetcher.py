@@ -1,5 +1,11 @@
 import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -7,9 +13,18 @@ from selenium.webdriver.support import expected_conditions as EC
 
 logger = logging.getLogger(__name__)
 
-def fetch_tweet_image_urls_via_selenium(short_url: str) -> list[str]:
+_TWEET_PHOTO_SELECTOR = "div[data-testid='tweetPhoto'] img"
+
+# ─── WebDriver 풀 ─────────────────────────────────────────────────────
+# Chrome 기동이 가장 느린 단계이므로 사용한 드라이버를 닫지 않고 다음 호출에서 재사용
+# 동시에 살아 있는 드라이버는 최대 DRIVER_POOL_SIZE개
+DRIVER_POOL_SIZE = 4
+_idle_drivers: "queue.LifoQueue[webdriver.Chrome]" = queue.LifoQueue()
+_driver_slots = threading.BoundedSemaphore(DRIVER_POOL_SIZE)
+
+def _chrome_options() -> Options:
     """
-    t.co 단축 URL을 열어서 tweetPhoto 이미지를 모두 크롤링
+    헤드리스 Chrome 실행 옵션
     """
     opts = Options()
     opts.add_argument("--headless=new")             # Chrome 109+ 권장 headless 모드
@@ -22,23 +37,80 @@ def fetch_tweet_image_urls_via_selenium(short_url: str) -> list[str]:
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     )
+    return opts
 
-    driver = webdriver.Chrome(options=opts)
-    try:
-        logger.info("Opening %s", short_url)
-        driver.get(short_url)
+def _collect_image_urls(driver: webdriver.Chrome, short_url: str) -> list[str]:
+    """
+    이미 떠 있는 브라우저로 URL을 열어 tweetPhoto 이미지 src 목록 반환
+    """
+    logger.info("Opening %s", short_url)
+    driver.get(short_url)
 
-        # 이미지가 로드될 때까지 대기 (최대 10초)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located(
-                (By.CSS_SELECTOR, "div[data-testid='tweetPhoto'] img")
-            )
-        )
+    # 이미지가 로드될 때까지 대기 (최대 10초)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_all_elements_located((By.CSS_SELECTOR, _TWEET_PHOTO_SELECTOR))
+    )
 
-        elems = driver.find_elements(By.CSS_SELECTOR, "div[data-testid='tweetPhoto'] img")
-        srcs = [e.get_attribute("src") for e in elems if e.get_attribute("src")]
-        logger.info("Found %d images", len(srcs))
-        return srcs
+    elems = driver.find_elements(By.CSS_SELECTOR, _TWEET_PHOTO_SELECTOR)
+    srcs = [e.get_attribute("src") for e in elems if e.get_attribute("src")]
+    logger.info("Found %d images", len(srcs))
+    return srcs
 
+@contextmanager
+def _borrow_driver() -> Iterator[webdriver.Chrome]:
+    """
+    풀에서 드라이버를 빌려오고 (없으면 새로 기동) 사용 후 반납
+    - 풀이 가득 차 있으면 다른 호출이 반납할 때까지 대기
+    - 사용 중 예외가 나면 드라이버 상태를 신뢰할 수 없으므로 반납하지 않고 종료
+    """
+    _driver_slots.acquire()
+    try:
+        try:
+            driver = _idle_drivers.get_nowait()
+        except queue.Empty:
+            driver = webdriver.Chrome(options=_chrome_options())
+        try:
+            yield driver
+        except BaseException:
+            driver.quit()
+            raise
+        _idle_drivers.put(driver)
     finally:
-        driver.quit()
\ No newline at end of file
+        _driver_slots.release()
+
+def close_driver_pool() -> None:
+    """
+    풀에 남아 있는 드라이버를 모두 종료 (앱 종료 시 호출)
+    """
+    while True:
+        try:
+            driver = _idle_drivers.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("WebDriver 종료 실패: %s", e)
+
+def fetch_tweet_image_urls_via_selenium(short_url: str) -> list[str]:
+    """
+    t.co 단축 URL을 열어서 tweetPhoto 이미지를 모두 크롤링
+    """
+    with _borrow_driver() as driver:
+        return _collect_image_urls(driver, short_url)
+
+def fetch_many_tweet_image_urls_via_selenium(short_urls: List[str]) -> Dict[str, list[str]]:
+    """
+    여러 URL을 풀에서 빌린 브라우저 하나로 차례대로 열어 tweetPhoto 이미지를 크롤링
+    - 이미지 로드 대기 시간 초과는 빈 목록으로 기록하고 다음 URL 계속 진행
+    - 그 밖의 WebDriver 오류는 드라이버를 폐기하고 호출 측으로 전달
+    """
+    results: Dict[str, list[str]] = {}
+    with _borrow_driver() as driver:
+        for url in short_urls:
+            try:
+                results[url] = _collect_image_urls(driver, url)
+            except TimeoutException:
+                logger.warning("이미지 로드 대기 시간 초과: %s", url)
+                results[url] = []
+    return results
@@ -1,17 +1,104 @@
 import asyncio
-from typing import List
-from .selenium_image_fetcher import fetch_tweet_image_urls_via_selenium
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from .selenium_image_fetcher import (
+    DRIVER_POOL_SIZE,
+    fetch_tweet_image_urls_via_selenium,
+    fetch_many_tweet_image_urls_via_selenium,
+)
+
+# Selenium 전용 워커 스레드 (WebDriver 풀 크기와 동일)
+# → 기본 executor(asyncio.to_thread)를 쓰는 RAG 조회/파일 I/O가 브라우저 대기에 밀리지 않도록 분리
+_selenium_executor = ThreadPoolExecutor(
+    max_workers=DRIVER_POOL_SIZE, thread_name_prefix="selenium"
+)
+
+# ─── 해석 결과 캐시 ─────────────────────────────────────────────────────
+# 같은 t.co / 사진 링크는 타임라인·재동기화에서 반복되므로 TTL 동안 Selenium 없이 재사용
+# (TcoResolver는 서비스마다 생성되므로 모듈 전역으로 공유)
+RESOLVE_CACHE_TTL = 3600.0
+RESOLVE_CACHE_SIZE = 10_000
+_resolve_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+def _cache_get(url: str) -> str | None:
+    """
+    만료되지 않은 해석 결과 반환 (없으면 None)
+    """
+    cached = _resolve_cache.get(url)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    _resolve_cache.move_to_end(url)
+    return cached[1]
+
+def _cache_put(url: str, resolved: str) -> None:
+    """
+    해석 결과를 저장하고 최근 사용 순으로 RESOLVE_CACHE_SIZE개까지만 유지
+    """
+    _resolve_cache[url] = (time.monotonic() + RESOLVE_CACHE_TTL, resolved)
+    _resolve_cache.move_to_end(url)
+    while len(_resolve_cache) > RESOLVE_CACHE_SIZE:
+        _resolve_cache.popitem(last=False)
 
 class TcoResolver:
     """
-    Blocking Selenium 호출을 asyncio.to_thread 로 감싸서 비동기로 사용
+    Blocking Selenium 호출을 전용 스레드 풀(run_in_executor)로 감싸서 비동기로 사용
+    - 이미지를 찾은 URL은 RESOLVE_CACHE_TTL초 동안 프로세스 전역 캐시에서 재사용
     """
     async def resolve(self, orig_urls: List[str]) -> List[str]:
+        # 같은 URL은 한 번만 해석하고 결과를 재사용 (입력 순서/길이는 그대로 유지)
+        cache: Dict[str, str] = {}
         resolved: List[str] = []
         for url in orig_urls:
-            if "t.co/" in url or "twitter.com/photo" in url:
-                imgs = await asyncio.to_thread(fetch_tweet_image_urls_via_selenium, url)
-                resolved.append(imgs[0] if imgs else url)
+            if url not in cache:
+                if "t.co/" in url or "twitter.com/photo" in url:
+                    hit = _cache_get(url)
+                    if hit is None:
+                        imgs = await asyncio.get_running_loop().run_in_executor(
+                            _selenium_executor, fetch_tweet_image_urls_via_selenium, url
+                        )
+                        if imgs:
+                            _cache_put(url, imgs[0])
+                        hit = imgs[0] if imgs else url
+                    cache[url] = hit
+                else:
+                    cache[url] = url
+            resolved.append(cache[url])
+        return resolved
+
+    async def resolve_many(self, orig_urls: List[str]) -> Dict[str, str]:
+        """
+        여러 URL을 브라우저 하나로 한 번에 해석
+        - 해석 대상(t.co / twitter.com/photo)만 중복 제거 후 워커 스레드 1개에서 처리
+        - 캐시에 있는 URL은 브라우저를 띄우지 않고 바로 반환
+        - 이미지를 찾지 못한 URL은 원본 URL로 대체 (캐시하지 않고 다음에 다시 시도)
+        Returns:
+            {원본 URL: 해석된 URL} (해석 대상 URL만 포함)
+        """
+        targets = [
+            url for url in dict.fromkeys(orig_urls)
+            if "t.co/" in url or "twitter.com/photo" in url
+        ]
+        resolved: Dict[str, str] = {}
+        misses: List[str] = []
+        for url in targets:
+            hit = _cache_get(url)
+            if hit is None:
+                misses.append(url)
+            else:
+                resolved[url] = hit
+        if not misses:
+            return resolved
+
+        found = await asyncio.get_running_loop().run_in_executor(
+            _selenium_executor, fetch_many_tweet_image_urls_via_selenium, misses
+        )
+        for url in misses:
+            imgs = found.get(url)
+            if imgs:
+                _cache_put(url, imgs[0])
+                resolved[url] = imgs[0]
             else:
-                resolved.append(url)
-        return resolved
\ No newline at end of file
+                resolved[url] = url
+        return resolved
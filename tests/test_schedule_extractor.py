@@ -0,0 +1,45 @@
+import pytest
+
+from app.services.llm.schedule_extractor import extract_schedule
+
+REFERENCE = "2025-12-30 10:00:00"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # 시간 길이(1時間)는 시각으로 해석하지 않음
+        ("明日20時から1時間配信します", ("2025.12.31 20:00:00", "2025.12.31 21:00:00")),
+        # 참조일보다 이전 날짜는 다음 해로 넘김
+        ("1/3 21:00から", ("2026.01.03 21:00:00", "2026.01.03 22:00:00")),
+        # 자정을 넘는 범위는 종료를 다음날로
+        ("今夜23:00〜1:00", ("2025.12.30 23:00:00", "2025.12.31 01:00:00")),
+        # 방송 업계 표기 (24시 이상)
+        ("12/31 25:00〜27:00", ("2026.01.01 01:00:00", "2026.01.01 03:00:00")),
+        # 午前12時 → 00:00, 午後12時 → 12:00
+        ("明日午前12時から", ("2025.12.31 00:00:00", "2025.12.31 01:00:00")),
+        ("明日午後12時から", ("2025.12.31 12:00:00", "2025.12.31 13:00:00")),
+        ("今日午後10時半から", ("2025.12.30 22:30:00", "2025.12.30 23:30:00")),
+        # 등장 순서대로 start / end
+        ("12月31日 21時〜22時30分", ("2025.12.31 21:00:00", "2025.12.31 22:30:00")),
+    ],
+)
+def test_extract_schedule(text, expected):
+    assert extract_schedule(text, REFERENCE) == expected
+
+
+@pytest.mark.parametrize(
+    "text, timestamp",
+    [
+        # 시간 길이만 있고 시각이 없음
+        ("24時間配信！", REFERENCE),
+        # 날짜 단서가 없으면 LLM에 맡김
+        ("20時から配信します", REFERENCE),
+        # 시각이 없음
+        ("明日配信します", REFERENCE),
+        # timestamp 형식이 다름
+        ("明日20時から", "2025-12-30"),
+    ],
+)
+def test_extract_schedule_falls_back_to_llm(text, timestamp):
+    assert extract_schedule(text, timestamp) is None